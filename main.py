@@ -7,10 +7,6 @@ Desktop-App zur Generierung von SOMAS-Analyse-Prompts für YouTube-Videos.
 import sys
 import logging
 
-from PyQt6.QtWidgets import QApplication
-
-from src.gui.main_window import MainWindow
-
 
 def setup_logging():
     """Konfiguriert das Logging für die Anwendung."""
@@ -29,6 +25,12 @@ def main():
     logger = logging.getLogger(__name__)
     logger.info("Starte SOMAS Prompt Generator...")
 
+    # PyQt6 und das Hauptfenster erst nach dem Logging-Setup importieren –
+    # der Import ist der größte Einzelposten beim Start
+    from PyQt6.QtWidgets import QApplication
+
+    from src.gui.main_window import MainWindow
+
     app = QApplication(sys.argv)
     app.setApplicationName("SOMAS Prompt Generator")
 
@@ -1,5 +1,31 @@
-"""Konfiguration und Standardwerte."""
+"""Konfiguration und Standardwerte.
 
-from src.config.defaults import VideoInfo, SomasConfig, TimeRange, TEST_URLS
+Re-Exports werden per PEP 562 (``__getattr__``) erst beim Zugriff geladen.
+"""
+
+import importlib
+
+# Attributname → Modul innerhalb von src.config
+_LAZY_ATTRS = {
+    "VideoInfo": "defaults",
+    "SomasConfig": "defaults",
+    "TimeRange": "defaults",
+    "TEST_URLS": "defaults",
+}
 
 __all__ = ["VideoInfo", "SomasConfig", "TimeRange", "TEST_URLS"]
+
+
+def __getattr__(name: str):
+    """Importiert Re-Exports bei Bedarf und cacht sie im Modul-Namespace."""
+    module_name = _LAZY_ATTRS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    module = importlib.import_module(f"{__name__}.{module_name}")
+    value = getattr(module, name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
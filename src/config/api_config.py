@@ -3,12 +3,15 @@
 Trennt sensible Daten (API-Keys via keyring) von öffentlicher Config (JSON).
 """
 
-import json
+import atexit
+import copy
 import logging
+import os
 from dataclasses import dataclass
 from pathlib import Path
 
 import keyring
+import orjson
 
 logger = logging.getLogger(__name__)
 
@@ -19,10 +22,18 @@ _CONFIG_DIR = Path(__file__).parent
 _PROVIDERS_FILE = _CONFIG_DIR / "api_providers.json"
 _PREFERENCES_FILE = _CONFIG_DIR / "user_preferences.json"
 
+# In-Memory-Cache für api_providers.json, invalidiert über die mtime:
+# (mtime_ns, Roh-JSON, geparste Provider)
+_providers_cache: tuple[int, dict, dict[str, "ProviderDefinition"]] | None = None
+
+# Prozesslokaler Cache für keyring-Abfragen (provider_id → Key oder None),
+# spart wiederholte IPC-Roundtrips zum OS Credential Manager
+_keyring_cache: dict[str, str | None] = {}
+
 
 # --- Datenmodelle ---
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ProviderModel:
     """Ein verfügbares LLM-Modell."""
     id: str
@@ -30,9 +41,13 @@ class ProviderModel:
     description: str = ""
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ProviderDefinition:
-    """Definition eines API-Providers aus api_providers.json."""
+    """Definition eines API-Providers aus api_providers.json.
+
+    Unveränderlich (und daher gefahrlos aus dem Cache teilbar) – für eine
+    dynamisch geladene Modell-Liste mit dataclasses.replace() ersetzen.
+    """
     id: str
     name: str
     base_url: str
@@ -40,7 +55,7 @@ class ProviderDefinition:
     models_endpoint: str | None
     supports_dynamic_models: bool
     default_model: str
-    models: list[ProviderModel]
+    models: tuple[ProviderModel, ...]
     supports_web_search: bool = False
 
 
@@ -54,19 +69,27 @@ def save_api_key(provider_id: str, api_key: str) -> None:
         api_key: Der API-Key.
     """
     keyring.set_password(SERVICE_NAME, f"{provider_id}_api_key", api_key)
+    _keyring_cache[provider_id] = api_key
     logger.info(f"API-Key für '{provider_id}' gespeichert")
 
 
 def get_api_key(provider_id: str) -> str | None:
     """Holt API-Key aus dem OS Credential Manager.
 
+    Das Ergebnis wird pro Provider gecacht; save_api_key() und
+    delete_api_key() halten den Cache aktuell.
+
     Args:
         provider_id: Provider-ID (z.B. 'perplexity').
 
     Returns:
         API-Key oder None wenn nicht konfiguriert.
     """
-    return keyring.get_password(SERVICE_NAME, f"{provider_id}_api_key")
+    if provider_id not in _keyring_cache:
+        _keyring_cache[provider_id] = keyring.get_password(
+            SERVICE_NAME, f"{provider_id}_api_key"
+        )
+    return _keyring_cache[provider_id]
 
 
 def delete_api_key(provider_id: str) -> None:
@@ -80,6 +103,7 @@ def delete_api_key(provider_id: str) -> None:
         logger.info(f"API-Key für '{provider_id}' gelöscht")
     except keyring.errors.PasswordDeleteError:
         pass  # Key existierte nicht
+    _keyring_cache[provider_id] = None
 
 
 def has_api_key(provider_id: str) -> bool:
@@ -96,9 +120,56 @@ def has_api_key(provider_id: str) -> bool:
 
 # --- Provider-Definitionen (JSON) ---
 
+def _load_providers_cached() -> tuple[dict, dict[str, ProviderDefinition]]:
+    """Liest api_providers.json höchstens einmal pro Dateiänderung.
+
+    Returns:
+        Tupel aus Roh-JSON und geparsten Provider-Definitionen.
+
+    Raises:
+        OSError: Wenn die Datei nicht lesbar ist.
+        ValueError: Bei ungültigem JSON.
+    """
+    global _providers_cache
+
+    mtime = _PROVIDERS_FILE.stat().st_mtime_ns
+    if _providers_cache is not None and _providers_cache[0] == mtime:
+        return _providers_cache[1], _providers_cache[2]
+
+    data = orjson.loads(_PROVIDERS_FILE.read_bytes())
+
+    providers = {
+        p["id"]: ProviderDefinition(
+            id=p["id"],
+            name=p["name"],
+            base_url=p["base_url"],
+            chat_endpoint=p["chat_endpoint"],
+            models_endpoint=p.get("models_endpoint"),
+            supports_dynamic_models=p.get("supports_dynamic_models", False),
+            default_model=p.get("default_model", ""),
+            models=tuple(
+                ProviderModel(
+                    id=m["id"],
+                    name=m["name"],
+                    description=m.get("description", ""),
+                )
+                for m in p.get("models", [])
+            ),
+            supports_web_search=p.get("supports_web_search", False),
+        )
+        for p in data.get("providers", [])
+    }
+
+    logger.info(f"{len(providers)} Provider geladen: {list(providers.keys())}")
+    _providers_cache = (mtime, data, providers)
+    return data, providers
+
+
 def load_providers() -> dict[str, ProviderDefinition]:
     """Lädt Provider-Definitionen aus api_providers.json.
 
+    Die Datei wird nur bei geänderter mtime neu geparst.
+
     Returns:
         Dict von provider_id → ProviderDefinition.
     """
@@ -107,34 +178,8 @@ def load_providers() -> dict[str, ProviderDefinition]:
         return {}
 
     try:
-        with open(_PROVIDERS_FILE, encoding="utf-8") as f:
-            data = json.load(f)
-
-        providers: dict[str, ProviderDefinition] = {}
-        for p in data.get("providers", []):
-            models = [
-                ProviderModel(
-                    id=m["id"],
-                    name=m["name"],
-                    description=m.get("description", ""),
-                )
-                for m in p.get("models", [])
-            ]
-            providers[p["id"]] = ProviderDefinition(
-                id=p["id"],
-                name=p["name"],
-                base_url=p["base_url"],
-                chat_endpoint=p["chat_endpoint"],
-                models_endpoint=p.get("models_endpoint"),
-                supports_dynamic_models=p.get("supports_dynamic_models", False),
-                default_model=p.get("default_model", ""),
-                models=models,
-                supports_web_search=p.get("supports_web_search", False),
-            )
-
-        logger.info(f"{len(providers)} Provider geladen: {list(providers.keys())}")
-        return providers
-
+        _, providers = _load_providers_cached()
+        return dict(providers)
     except Exception as e:
         logger.error(f"Fehler beim Laden der Provider: {e}")
         return {}
@@ -147,8 +192,7 @@ def get_default_provider_id() -> str:
         Provider-ID aus der JSON-Config oder 'perplexity' als Fallback.
     """
     try:
-        with open(_PROVIDERS_FILE, encoding="utf-8") as f:
-            data = json.load(f)
+        data, _ = _load_providers_cached()
         return data.get("default_provider", "perplexity")
     except Exception:
         return "perplexity"
@@ -156,21 +200,122 @@ def get_default_provider_id() -> str:
 
 # --- User Preferences (nicht-sensitive Config) ---
 
+class _Preferences:
+    """Prozessweiter Halter der User-Preferences (Singleton ``_PREFS``).
+
+    Die Datei wird einmalig gelesen und nur bei geänderter mtime neu
+    geladen. Kleine Änderungen (z.B. letzte Modellauswahl) werden nur im
+    Speicher markiert und gebündelt per flush() geschrieben – spätestens
+    beim Programmende (atexit).
+    """
+
+    def __init__(self) -> None:
+        self._data: dict | None = None
+        self._mtime: int | None = None
+        self._dirty = False
+
+    @property
+    def data(self) -> dict:
+        """Kanonisches Preferences-Dict (keine Kopie, nur modulintern)."""
+        if self._dirty and self._data is not None:
+            # Ungespeicherte Änderungen haben Vorrang vor der Datei
+            return self._data
+
+        try:
+            mtime = _PREFERENCES_FILE.stat().st_mtime_ns
+        except FileNotFoundError:
+            if self._data is None or self._mtime is not None:
+                self._data, self._mtime = {}, None
+            return self._data
+        except OSError as e:
+            logger.error(f"Fehler beim Laden der Preferences: {e}")
+            return self._reset()
+
+        if self._data is None or self._mtime != mtime:
+            try:
+                self._data = orjson.loads(_PREFERENCES_FILE.read_bytes())
+                self._mtime = mtime
+            except Exception as e:
+                logger.error(f"Fehler beim Laden der Preferences: {e}")
+                return self._reset()
+
+        return self._data
+
+    def _reset(self) -> dict:
+        """Ersetzt den Cache nach einem Ladefehler durch ein leeres Dict.
+
+        Es wird dasselbe Objekt gehalten und zurückgegeben, damit darauf
+        vorgemerkte Änderungen beim nächsten flush() die (defekte) Datei
+        überschreiben.
+        """
+        self._data, self._mtime = {}, None
+        return self._data
+
+    def mark_dirty(self) -> None:
+        """Markiert das Dict als geändert (Schreiben erfolgt in flush())."""
+        self._dirty = True
+
+    def replace(self, prefs: dict) -> None:
+        """Übernimmt ein komplettes Preferences-Dict und schreibt sofort.
+
+        Args:
+            prefs: Neues Preferences-Dict (wird übernommen, nicht kopiert).
+
+        Raises:
+            OSError: Wenn die Datei nicht geschrieben werden kann.
+        """
+        self._data = prefs
+        self._dirty = True
+        self.flush()
+
+    def flush(self) -> None:
+        """Schreibt ausstehende Änderungen atomar auf die Platte.
+
+        Geschrieben wird in eine temporäre Datei, die anschließend per
+        os.replace() die eigentliche Datei ersetzt – ein Abbruch mitten im
+        Schreiben hinterlässt so nie eine halbe JSON-Datei.
+
+        Raises:
+            OSError: Wenn die Datei nicht geschrieben werden kann.
+        """
+        if not self._dirty or self._data is None:
+            return
+
+        tmp_file = _PREFERENCES_FILE.with_suffix(".json.tmp")
+        tmp_file.write_bytes(orjson.dumps(self._data, option=orjson.OPT_INDENT_2))
+        os.replace(tmp_file, _PREFERENCES_FILE)
+        self._mtime = _PREFERENCES_FILE.stat().st_mtime_ns
+        self._dirty = False
+
+    def invalidate(self) -> None:
+        """Verwirft den Cache (nächster Zugriff liest die Datei neu)."""
+        self._data, self._mtime, self._dirty = None, None, False
+
+
+_PREFS = _Preferences()
+
+
+def flush_preferences() -> None:
+    """Schreibt gepufferte Preferences-Änderungen sofort auf die Platte."""
+    try:
+        _PREFS.flush()
+    except Exception as e:
+        logger.error(f"Fehler beim Speichern der Preferences: {e}")
+
+
+atexit.register(flush_preferences)
+
+
 def load_preferences() -> dict:
     """Lädt User-Preferences aus user_preferences.json.
 
+    Zurückgegeben wird eine Kopie, damit Aufrufer den Cache nicht
+    versehentlich ändern.
+
     Returns:
         Dict mit Preferences oder leeres Dict.
     """
-    if not _PREFERENCES_FILE.exists():
-        return {}
-
-    try:
-        with open(_PREFERENCES_FILE, encoding="utf-8") as f:
-            return json.load(f)
-    except Exception as e:
-        logger.error(f"Fehler beim Laden der Preferences: {e}")
-        return {}
+    return copy.deepcopy(_PREFS.data)
 
 
 def save_preferences(prefs: dict) -> None:
@@ -180,10 +325,10 @@ def save_preferences(prefs: dict) -> None:
         prefs: Dict mit Preferences.
     """
     try:
-        with open(_PREFERENCES_FILE, "w", encoding="utf-8") as f:
-            json.dump(prefs, f, indent=2, ensure_ascii=False)
+        _PREFS.replace(copy.deepcopy(prefs))
         logger.info("User-Preferences gespeichert")
     except Exception as e:
+        _PREFS.invalidate()
         logger.error(f"Fehler beim Speichern der Preferences: {e}")
 
 
@@ -193,8 +338,7 @@ def get_last_provider() -> str:
     Returns:
         Provider-ID oder Default-Provider.
     """
-    prefs = load_preferences()
-    return prefs.get("last_provider", get_default_provider_id())
+    return _PREFS.data.get("last_provider", get_default_provider_id())
 
 
 def get_last_model(provider_id: str) -> str | None:
@@ -206,20 +350,20 @@ def get_last_model(provider_id: str) -> str | None:
     Returns:
         Modell-ID oder None.
     """
-    prefs = load_preferences()
-    return prefs.get("last_models", {}).get(provider_id)
+    return _PREFS.data.get("last_models", {}).get(provider_id)
 
 
 def save_last_selection(provider_id: str, model_id: str) -> None:
     """Speichert die letzte Provider/Modell-Auswahl.
 
+    Die Änderung wird nur im Speicher vorgemerkt und beim nächsten
+    flush_preferences() bzw. spätestens beim Programmende geschrieben.
+
     Args:
         provider_id: Provider-ID.
         model_id: Modell-ID.
     """
-    prefs = load_preferences()
+    prefs = _PREFS.data
     prefs["last_provider"] = provider_id
-    if "last_models" not in prefs:
-        prefs["last_models"] = {}
-    prefs["last_models"][provider_id] = model_id
-    save_preferences(prefs)
+    prefs.setdefault("last_models", {})[provider_id] = model_id
+    _PREFS.mark_dirty()
@@ -1,6 +1,7 @@
 """SOMAS-Konfiguration und Standardwerte."""
 
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import Optional
 
 
@@ -46,9 +47,19 @@ class SomasConfig:
         return DEPTH_SENTENCES.get(self.depth, 3)
 
 
-@dataclass
+@lru_cache(maxsize=256)
+def _format_duration(seconds: int) -> str:
+    """Formatiert Sekunden als MM:SS oder HH:MM:SS (memoisiert)."""
+    hours, remainder = divmod(seconds, 3600)
+    minutes, seconds = divmod(remainder, 60)
+    if hours > 0:
+        return f"{hours}:{minutes:02d}:{seconds:02d}"
+    return f"{minutes}:{seconds:02d}"
+
+
+@dataclass(frozen=True, slots=True)
 class VideoInfo:
-    """Metadaten eines YouTube-Videos."""
+    """Metadaten eines YouTube-Videos (unveränderlich)."""
     title: str
     channel: str
     duration: int  # Sekunden
@@ -58,11 +69,7 @@ class VideoInfo:
     @property
     def duration_formatted(self) -> str:
         """Formatiert die Dauer als MM:SS oder HH:MM:SS."""
-        hours, remainder = divmod(self.duration, 3600)
-        minutes, seconds = divmod(remainder, 60)
-        if hours > 0:
-            return f"{hours}:{minutes:02d}:{seconds:02d}"
-        return f"{minutes}:{seconds:02d}"
+        return _format_duration(self.duration)
 
 
 # Test-URLs für Entwicklung
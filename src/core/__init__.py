@@ -1,9 +1,21 @@
-"""Business-Logik für den SOMAS Prompt Generator."""
+"""Business-Logik für den SOMAS Prompt Generator.
 
-from src.core.youtube_client import get_video_info, get_transcript, extract_video_id
-from src.core.prompt_builder import build_prompt
-from src.core.linkedin_formatter import format_for_linkedin
-from src.core.export import export_to_markdown
+Die Re-Exports werden per PEP 562 (``__getattr__``) erst beim ersten
+Zugriff importiert. So zieht z.B. ``import src.core.api_worker`` nicht
+yt-dlp, Jinja2 und die Export-Module mit.
+"""
+
+import importlib
+
+# Attributname → Modul innerhalb von src.core
+_LAZY_ATTRS = {
+    "get_video_info": "youtube_client",
+    "get_transcript": "youtube_client",
+    "extract_video_id": "youtube_client",
+    "build_prompt": "prompt_builder",
+    "format_for_linkedin": "linkedin_formatter",
+    "export_to_markdown": "export",
+}
 
 __all__ = [
     "get_video_info",
@@ -13,3 +25,18 @@ __all__ = [
     "format_for_linkedin",
     "export_to_markdown",
 ]
+
+
+def __getattr__(name: str):
+    """Importiert Re-Exports bei Bedarf und cacht sie im Modul-Namespace."""
+    module_name = _LAZY_ATTRS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    module = importlib.import_module(f"{__name__}.{module_name}")
+    value = getattr(module, name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
@@ -4,9 +4,15 @@ Definiert das Interface, das alle Provider-Implementierungen
 (Perplexity, OpenRouter, etc.) einhalten müssen.
 """
 
+import threading
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
 from enum import Enum
+from functools import cached_property
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    import requests
 
 
 class APIStatus(Enum):
@@ -18,9 +24,13 @@ class APIStatus(Enum):
     ERROR = "error"
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class APIResponse:
-    """Antwort eines LLM-API-Aufrufs."""
+    """Antwort eines LLM-API-Aufrufs.
+
+    Unveränderlich – nachträgliche Werte (z.B. die gemessene Dauer) per
+    dataclasses.replace() setzen.
+    """
     status: APIStatus
     content: str = ""
     error_message: str = ""
@@ -41,6 +51,11 @@ class LLMClient(ABC):
     PROVIDER_ID: str = ""
     PROVIDER_NAME: str = ""
 
+    @cached_property
+    def full_endpoint(self) -> str:
+        """Vollständige Chat-Endpoint-URL (für Debug-Logs), einmalig berechnet."""
+        return getattr(self, "BASE_URL", "") + getattr(self, "CHAT_ENDPOINT", "")
+
     @abstractmethod
     def get_available_models(self) -> list[dict]:
         """Gibt Liste der verfügbaren Modelle zurück.
@@ -77,6 +92,54 @@ class LLMClient(ABC):
             return False
 
 
+# Gemeinsame HTTP-Session der requests-basierten Clients (lazy erzeugt)
+_http_session: "requests.Session | None" = None
+_http_session_lock = threading.Lock()
+
+
+def get_http_session() -> "requests.Session":
+    """Gibt die prozessweit geteilte requests-Session zurück.
+
+    Die Session hält Keep-Alive-Verbindungen pro Host im Pool, sodass
+    TCP- und TLS-Handshake nicht bei jedem API-Call anfallen. Transiente
+    Gateway-Fehler (502/503/504) werden nur bei idempotenten Methoden
+    (z.B. GET /models) wiederholt, nie bei POST – ein Prompt wird also
+    nicht doppelt abgerechnet.
+
+    Antworten werden bewusst nicht gestreamt: das Ergebnis wird erst
+    komplett weiterverarbeitet, daher parsen die Clients den fertigen
+    Body (``response.content``) direkt mit orjson, ohne Zwischenkopie.
+
+    Returns:
+        Die geteilte requests.Session.
+    """
+    global _http_session
+    if _http_session is not None:
+        return _http_session
+
+    with _http_session_lock:
+        # Erneut prüfen: ein anderer Worker-Thread kann die Session
+        # inzwischen angelegt haben
+        if _http_session is None:
+            import requests
+            from requests.adapters import HTTPAdapter
+            from urllib3.util.retry import Retry
+
+            session = requests.Session()
+            session.mount("https://", HTTPAdapter(
+                pool_connections=4,
+                pool_maxsize=16,
+                max_retries=Retry(
+                    total=2,
+                    backoff_factor=0.3,
+                    status_forcelist=(502, 503, 504),
+                    raise_on_status=False,
+                ),
+            ))
+            _http_session = session
+    return _http_session
+
+
 def create_client(provider_id: str, api_key: str) -> LLMClient:
     """Erstellt den passenden API-Client für einen Provider.
 
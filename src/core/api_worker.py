@@ -1,22 +1,29 @@
-"""QThread-Worker für non-blocking API-Aufrufe.
+"""Pool-Worker für non-blocking API-Aufrufe.
 
-Führt LLM-API-Calls in einem separaten Thread aus,
-damit die GUI während des Wartens responsiv bleibt.
+Führt LLM-API-Calls in einem Thread des globalen QThreadPool aus,
+damit die GUI während des Wartens responsiv bleibt. Threads werden
+wiederverwendet statt pro Request einen neuen QThread zu erzeugen.
 """
 
 import logging
+import threading
 import time
+from dataclasses import replace
+from types import MappingProxyType
 
-from PyQt6.QtCore import QThread, pyqtSignal
+from PyQt6.QtCore import QObject, QRunnable, QThreadPool, pyqtSignal
 
 from .api_client import APIResponse, APIStatus, LLMClient
 from .debug_logger import DebugLogger
 
 logger = logging.getLogger(__name__)
 
+# Geteiltes, unveränderliches Leer-Meta für Worker ohne Debug-Meta
+_EMPTY_META = MappingProxyType({})
 
-class APIWorker(QThread):
-    """Worker-Thread für API-Aufrufe ohne UI-Blockierung.
+
+class WorkerSignals(QObject):
+    """Signal-Träger für APIWorker (QRunnable kann selbst keine Signals haben).
 
     Signals:
         status_changed: Emittiert bei Statuswechsel (APIStatus-Wert als String).
@@ -28,6 +35,16 @@ class APIWorker(QThread):
     response_received = pyqtSignal(object)
     error_occurred = pyqtSignal(str)
 
+
+class APIWorker(QRunnable):
+    """Pool-Worker für API-Aufrufe ohne UI-Blockierung.
+
+    Die Signals liegen auf ``self.signals`` (WorkerSignals) und sind unter
+    den gewohnten Namen (``status_changed`` etc.) direkt am Worker
+    erreichbar. ``start()``, ``isRunning()`` und ``wait()`` bilden die
+    bisherige QThread-Schnittstelle nach.
+    """
+
     def __init__(
         self, client: LLMClient, prompt: str, model: str,
         debug_logger: DebugLogger | None = None,
@@ -43,15 +60,53 @@ class APIWorker(QThread):
             debug_meta: Optionale Meta-Informationen für Debug-Logs.
         """
         super().__init__()
+        # Lebensdauer wird von Python verwaltet, nicht vom Pool
+        self.setAutoDelete(False)
+        self.signals = WorkerSignals()
+        self.status_changed = self.signals.status_changed
+        self.response_received = self.signals.response_received
+        self.error_occurred = self.signals.error_occurred
+        self._started = False
+        self._finished = threading.Event()
         self.client = client
         self.prompt = prompt
         self.model = model
         self._cancelled = False
         self._debug_logger = debug_logger
-        self._debug_meta = debug_meta or {}
+        self._debug_meta = debug_meta or _EMPTY_META
+
+    def start(self) -> None:
+        """Reiht den Worker in den globalen QThreadPool ein."""
+        self._started = True
+        QThreadPool.globalInstance().start(self)
+
+    def isRunning(self) -> bool:
+        """True solange der Worker gestartet, aber noch nicht fertig ist."""
+        return self._started and not self._finished.is_set()
+
+    def wait(self, msecs: int | None = None) -> bool:
+        """Wartet auf das Ende des Workers.
+
+        Args:
+            msecs: Maximale Wartezeit in Millisekunden (None = unbegrenzt).
+
+        Returns:
+            True wenn der Worker beendet ist.
+        """
+        if not self._started:
+            return True
+        timeout = None if msecs is None else msecs / 1000
+        return self._finished.wait(timeout)
 
     def run(self) -> None:
-        """Führt den API-Call im Worker-Thread aus."""
+        """Führt den API-Call in einem Pool-Thread aus."""
+        try:
+            self._run()
+        finally:
+            self._finished.set()
+
+    def _run(self) -> None:
+        """Eigentlicher API-Call inkl. Status-Signals und Debug-Logging."""
         if self._cancelled:
             return
 
@@ -61,25 +116,23 @@ class APIWorker(QThread):
         # Debug: Request loggen
         log_dir = None
         if self._debug_logger:
-            endpoint = getattr(self.client, 'BASE_URL', '') + getattr(
-                self.client, 'CHAT_ENDPOINT', ''
-            )
             log_dir = self._debug_logger.log_request(
                 provider=self.client.PROVIDER_ID,
                 model=self.model,
-                endpoint=endpoint,
+                endpoint=self.client.full_endpoint,
                 prompt=self.prompt,
                 meta=self._debug_meta,
             )
 
-        start_time = time.time()
+        start_time = time.perf_counter()
 
         try:
-            self.status_changed.emit(APIStatus.PROCESSING.value)
-
+            # Kein separates PROCESSING-Signal: zwischen SENDING und dem
+            # Request liegt keine Arbeit, ein zweiter Cross-Thread-Emit
+            # würde nur ein zusätzliches Repaint auslösen.
             response = self.client.send_prompt(self.prompt, self.model)
-            duration = time.time() - start_time
-            response.duration_seconds = duration
+            duration = time.perf_counter() - start_time
+            response = replace(response, duration_seconds=duration)
 
             if self._cancelled:
                 logger.info("API-Worker abgebrochen")
@@ -120,7 +173,7 @@ class APIWorker(QThread):
                     )
 
         except Exception as e:
-            duration = time.time() - start_time
+            duration = time.perf_counter() - start_time
             if not self._cancelled:
                 self.status_changed.emit(APIStatus.ERROR.value)
                 self.error_occurred.emit(str(e))
@@ -6,7 +6,9 @@ URL → Metadaten → Transkript → Prompt → API-Call → Speicherung.
 
 import logging
 import time
+from dataclasses import replace
 
+from jinja2 import Environment
 from PyQt6.QtCore import QThread, pyqtSignal
 
 from .api_client import APIResponse, APIStatus, LLMClient, create_client
@@ -17,6 +19,7 @@ from .prompt_builder import (
     build_prompt_from_transcript,
     get_anti_monotony_hint,
     get_preset_by_name,
+    get_template_env,
 )
 from .rating_store import (
     AnalysisRecord,
@@ -91,13 +94,16 @@ class BatchWorker(QThread):
             self.batch_finished.emit()
             return
 
+        # Template-Umgebung einmal für alle Items holen
+        env = get_template_env()
+
         for i, item in enumerate(self._items):
             if self._cancelled:
                 logger.info("Batch abgebrochen")
                 break
 
             try:
-                self._process_single_item(i, item, client)
+                self._process_single_item(i, item, client, env)
             except Exception as e:
                 logger.exception(f"Batch-Item {i+1} fehlgeschlagen")
                 item.status = "error"
@@ -111,7 +117,8 @@ class BatchWorker(QThread):
         self.batch_finished.emit()
 
     def _process_single_item(
-        self, index: int, item: BatchItem, client: LLMClient
+        self, index: int, item: BatchItem, client: LLMClient,
+        env: Environment | None = None,
     ) -> None:
         """Verarbeitet ein einzelnes BatchItem.
 
@@ -154,6 +161,7 @@ class BatchWorker(QThread):
                 is_auto_transcript=True,
                 perspective=self._config.perspective,
                 anti_monotony_hint=anti_monotony_hint,
+                env=env,
             )
         else:
             prompt = build_prompt(
@@ -162,6 +170,7 @@ class BatchWorker(QThread):
                 preset_name=self._config.preset_name,
                 perspective=self._config.perspective,
                 anti_monotony_hint=anti_monotony_hint,
+                env=env,
             )
 
         item.prompt = prompt
@@ -173,10 +182,10 @@ class BatchWorker(QThread):
         self.item_status_changed.emit(index, "calling")
         item.status = "calling"
 
-        start_time = time.time()
+        start_time = time.perf_counter()
         response = client.send_prompt(prompt, self._config.model_id)
-        duration = time.time() - start_time
-        response.duration_seconds = duration
+        duration = time.perf_counter() - start_time
+        response = replace(response, duration_seconds=duration)
 
         if response.status != APIStatus.RECEIVED:
             raise RuntimeError(
@@ -10,8 +10,8 @@ gelten für BEIDE Analysen identisch — variiert wird nur das Modell.
 
 import logging
 import time
+from dataclasses import replace
 
-from jinja2 import Environment, FileSystemLoader
 from PyQt6.QtCore import QThread, pyqtSignal
 
 from src.config.api_config import get_api_key
@@ -25,7 +25,7 @@ from .prompt_builder import (
     build_prompt_from_transcript,
     build_synthesis_prompt,
     clean_synthesis_output,
-    get_template_dir,
+    get_template_env,
     normalize_markdown_headings,
 )
 from .youtube_client import build_thumbnail_urls, extract_video_id, get_video_info
@@ -270,19 +270,18 @@ class ComparisonWorker(QThread):
         """Sendet einen Prompt, misst die Dauer und loggt optional (Debug)."""
         log_dir = None
         if self._debug_logger:
-            endpoint = getattr(client, "BASE_URL", "") + getattr(client, "CHAT_ENDPOINT", "")
             log_dir = self._debug_logger.log_request(
                 provider=getattr(client, "PROVIDER_ID", ""),
                 model=model_id,
-                endpoint=endpoint,
+                endpoint=client.full_endpoint,
                 prompt=prompt,
                 meta=self._debug_meta(video_info, step_label),
             )
 
-        start = time.time()
+        start = time.perf_counter()
         response = client.send_prompt(prompt, model_id)
-        duration = time.time() - start
-        response.duration_seconds = duration
+        duration = time.perf_counter() - start
+        response = replace(response, duration_seconds=duration)
 
         if self._debug_logger:
             ok = response.status == APIStatus.RECEIVED
@@ -325,12 +324,7 @@ class ComparisonWorker(QThread):
             if video_id:
                 thumb = build_thumbnail_urls(video_id)
 
-        env = Environment(
-            loader=FileSystemLoader(get_template_dir()),
-            trim_blocks=True,
-            lstrip_blocks=True,
-        )
-        template = env.get_template("somas_comparison.txt")
+        template = get_template_env().get_template("somas_comparison.txt")
         return template.render(
             video_title=video_info.title,
             channel=video_info.channel,
@@ -1,36 +1,86 @@
 """Debug-Logger für API-Request/Response-Nachvollziehbarkeit.
 
-Speichert vollständige API-Interaktionen als JSON-Dateien in %TEMP%/somas_debug/
-für Fehleranalyse bei Halluzinationen, Fehlidentifikationen und unerwarteten Outputs.
+Speichert vollständige API-Interaktionen (JSON-Metadaten + Prompt/Antwort als
+Textdateien) in %TEMP%/somas_debug/ für Fehleranalyse bei Halluzinationen, Fehlidentifikationen und unerwarteten Outputs.
 """
 
-import json
+import atexit
 import logging
 import os
 import re
 import shutil
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
+from typing import Callable
+
+import orjson
 
 logger = logging.getLogger(__name__)
 
 APP_VERSION = "0.9.1"
 
+# Zeichen, die in Windows-Dateinamen unzulässig sind (z.B. "/" in Modell-IDs)
+_UNSAFE_FILENAME_CHARS = re.compile(r'[<>:"/\\|?*]')
+
+# Basisverzeichnis einmalig beim Import bestimmen
+_DEFAULT_BASE_DIR = Path(os.environ.get('TEMP', '/tmp')) / 'somas_debug'
+
 
 class DebugLogger:
     """Logs API requests/responses to %TEMP%/somas_debug/.
 
     Jeder API-Call bekommt ein eigenes Unterverzeichnis mit:
-    - request.json (Prompt, Provider, Modell)
-    - response.json (Content, Tokens, Dauer, Fehler)
+    - request.json (Provider, Modell, Endpoint, Prompt-Länge)
+    - prompt.txt (gesendeter Prompt im Klartext)
+    - response.json (Tokens, Dauer, Fehler, Content-Länge)
+    - response.txt (Antwort-Inhalt im Klartext)
     - meta.json (App-Version, Preset, Video-Infos)
 
+    Prompt und Antwort liegen als rohe UTF-8-Textdateien neben dem JSON –
+    das spart JSON-Escaping großer Texte und macht sie direkt grep-bar.
+
     Aktivierung über User-Preferences (debug_logging: true).
+
+    Die Dateien werden von einem einzelnen Hintergrund-Thread geschrieben,
+    damit der API-Worker nicht auf Disk-I/O wartet. Ein Worker garantiert,
+    dass request.json vor response.json geschrieben wird.
     """
 
     def __init__(self, enabled: bool = False) -> None:
         self.enabled = enabled
-        self.base_dir = Path(os.environ.get('TEMP', '/tmp')) / 'somas_debug'
+        self.base_dir = _DEFAULT_BASE_DIR
+        self._executor: ThreadPoolExecutor | None = None
+        self._executor_lock = threading.Lock()
+
+    def _submit(self, func: Callable[..., None], *args) -> None:
+        """Reiht einen Schreibauftrag in den Hintergrund-Thread ein."""
+        if self._executor is None:
+            with self._executor_lock:
+                # Nur ein Executor pro Logger, sonst ginge die Reihenfolge
+                # request.json → response.json verloren
+                if self._executor is None:
+                    executor = ThreadPoolExecutor(
+                        max_workers=1, thread_name_prefix="somas_debug_log"
+                    )
+                    atexit.register(executor.shutdown, wait=True)
+                    self._executor = executor
+        self._executor.submit(self._run_safely, func, *args)
+
+    @staticmethod
+    def _run_safely(func: Callable[..., None], *args) -> None:
+        """Führt einen Schreibauftrag aus; Fehler werden nur geloggt."""
+        try:
+            func(*args)
+        except Exception:
+            logger.exception("Debug-Log konnte nicht geschrieben werden")
+
+    def flush(self) -> None:
+        """Wartet, bis alle ausstehenden Schreibaufträge erledigt sind."""
+        if self._executor is not None:
+            self._executor.submit(lambda: None).result()
 
     def log_request(
         self,
@@ -57,9 +107,8 @@ class DebugLogger:
 
         now = datetime.now()
         timestamp = now.strftime('%Y-%m-%d_%H-%M-%S')
-        safe_model = re.sub(r'[<>:"/\\|?*]', '_', model)
+        safe_model = _UNSAFE_FILENAME_CHARS.sub('_', model)
         log_dir = self.base_dir / f"{timestamp}_{provider}_{safe_model}"
-        log_dir.mkdir(parents=True, exist_ok=True)
 
         request_data = {
             "timestamp": now.isoformat(),
@@ -67,20 +116,32 @@ class DebugLogger:
             "model": model,
             "endpoint": endpoint,
             "prompt_length_chars": len(prompt),
-            "prompt": prompt,
+            "prompt_file": "prompt.txt",
         }
 
-        (log_dir / "request.json").write_text(
-            json.dumps(request_data, ensure_ascii=False, indent=2),
-            encoding='utf-8'
-        )
-        (log_dir / "meta.json").write_text(
-            json.dumps(meta, ensure_ascii=False, indent=2),
-            encoding='utf-8'
+        self._submit(
+            self._write_request, log_dir, request_data, prompt, dict(meta)
         )
+        return log_dir
 
+    @staticmethod
+    def _write_request(
+        log_dir: Path, request_data: dict, prompt: str, meta: dict
+    ) -> None:
+        """Schreibt request.json, prompt.txt und meta.json (Hintergrund-Thread)."""
+        try:
+            log_dir.mkdir(exist_ok=True)
+        except FileNotFoundError:
+            # Basisverzeichnis fehlt (erster Log oder nach clear_logs)
+            log_dir.mkdir(parents=True, exist_ok=True)
+        (log_dir / "request.json").write_bytes(
+            orjson.dumps(request_data, option=orjson.OPT_INDENT_2)
+        )
+        (log_dir / "prompt.txt").write_bytes(prompt.encode("utf-8"))
+        (log_dir / "meta.json").write_bytes(
+            orjson.dumps(meta, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+        )
         logger.info(f"Debug-Log: Request gespeichert in {log_dir}")
-        return log_dir
 
     def log_response(
         self,
@@ -127,20 +188,26 @@ class DebugLogger:
         if citations:
             response_data["citations"] = citations
 
-        response_data["content"] = content
+        response_data["content_file"] = "response.txt"
 
-        (log_dir / "response.json").write_text(
-            json.dumps(response_data, ensure_ascii=False, indent=2),
-            encoding='utf-8'
-        )
+        self._submit(self._write_response, log_dir, response_data, content)
 
+    @staticmethod
+    def _write_response(log_dir: Path, response_data: dict, content: str) -> None:
+        """Schreibt response.json und response.txt (Hintergrund-Thread)."""
+        (log_dir / "response.json").write_bytes(
+            orjson.dumps(response_data, option=orjson.OPT_INDENT_2)
+        )
+        (log_dir / "response.txt").write_bytes(content.encode("utf-8"))
         logger.info(
             f"Debug-Log: Response gespeichert "
-            f"({len(content)} Zeichen, {round(duration, 1)}s)"
+            f"({response_data['content_length_chars']} Zeichen, "
+            f"{response_data['duration_seconds']}s)"
         )
 
     def get_log_count(self) -> int:
         """Gibt die Anzahl vorhandener Debug-Logs zurück."""
+        self.flush()
         if not self.base_dir.exists():
             return 0
         return sum(1 for d in self.base_dir.iterdir() if d.is_dir())
@@ -148,12 +215,46 @@ class DebugLogger:
     def clear_logs(self) -> int:
         """Löscht alle Debug-Logs.
 
+        Das Basisverzeichnis wird atomar umbenannt und leer neu angelegt;
+        das eigentliche Löschen läuft in einem Hintergrund-Thread. Schlägt
+        das Umbenennen fehl (z.B. gesperrte Datei unter Windows), wird
+        verzeichnisweise gelöscht.
+
         Returns:
             Anzahl gelöschter Log-Verzeichnisse.
         """
+        self.flush()
         if not self.base_dir.exists():
             return 0
 
+        count = sum(1 for d in self.base_dir.iterdir() if d.is_dir())
+        trash_dir = self.base_dir.with_name(
+            f"{self.base_dir.name}_trash_{time.time_ns()}"
+        )
+        try:
+            self.base_dir.rename(trash_dir)
+        except OSError as e:
+            logger.warning(f"Debug-Logs nicht umbenennbar ({e}), lösche einzeln")
+            return self._clear_logs_in_place()
+
+        self.base_dir.mkdir(parents=True, exist_ok=True)
+        threading.Thread(
+            target=shutil.rmtree,
+            args=(trash_dir,),
+            kwargs={"ignore_errors": True},
+            name="somas_debug_clear",
+            daemon=True,
+        ).start()
+
+        logger.info(f"Debug-Logs gelöscht: {count} Einträge")
+        return count
+
+    def _clear_logs_in_place(self) -> int:
+        """Löscht die Log-Verzeichnisse einzeln (Fallback für clear_logs).
+
+        Returns:
+            Anzahl gelöschter Log-Verzeichnisse.
+        """
         count = 0
         for d in self.base_dir.iterdir():
             if d.is_dir():
@@ -10,9 +10,8 @@ Changelog v0.3.1:
 - Verbesserte Dateinamen-Bereinigung
 """
 
+import io
 import re
-import unicodedata
-from datetime import datetime
 from pathlib import Path
 from typing import Optional
 
@@ -45,6 +44,19 @@ UNICODE_REPLACEMENTS = {
     '\u200D': '',       # Zero Width Joiner → entfernen
     '\uFEFF': '',       # BOM → entfernen (wird beim Schreiben neu gesetzt)
 }
+# Alle Schlüssel sind Einzelzeichen: str.translate ersetzt damit sämtliche
+# Muster in einem linearen Durchlauf (wie ein Aho-Corasick-Automat, nur ohne
+# Zusatzabhängigkeit). Mehrzeichen-Schlüssel würde str.maketrans ablehnen.
+_UNICODE_REPLACEMENTS_TABLE = str.maketrans(UNICODE_REPLACEMENTS)
+
+# Übersetzungstabelle: ungültige Dateinamen-Zeichen und Control-Zeichen löschen
+# Windows: < > : " / \ | ? *   Mac: : /   Linux: / NUL
+_FILENAME_DELETE_TABLE = str.maketrans('', '', '<>:"/\\|?*' + ''.join(map(chr, range(0x20))))
+
+# Vorkompilierte Regex-Muster für die Dateinamen-Bereinigung
+_RE_NON_BMP = re.compile('[\U00010000-\U0010FFFF]')
+_RE_WHITESPACE = re.compile(r'\s+')
+_RE_UNDERSCORES = re.compile(r'_+')
 
 
 def sanitize_unicode_for_export(text: str) -> str:
@@ -59,14 +71,19 @@ def sanitize_unicode_for_export(text: str) -> str:
     Returns:
         Text mit ersetzten problematischen Zeichen
     """
-    # Normalisiere Unicode (NFC = kanonische Komposition)
-    text = unicodedata.normalize('NFC', text)
-    
-    # Ersetze bekannte problematische Zeichen
-    for old, new in UNICODE_REPLACEMENTS.items():
-        text = text.replace(old, new)
+    # Reiner ASCII-Text ist bereits NFC und enthält keines der Zeichen
+    if text.isascii():
+        return text
+
+    import unicodedata  # erst bei Bedarf laden (ASCII-Pfad braucht es nicht)
+
+    # Normalisiere Unicode (NFC = kanonische Komposition); der Quick Check
+    # spart die Kopie bei bereits normalisiertem Text (der Normalfall)
+    if not unicodedata.is_normalized('NFC', text):
+        text = unicodedata.normalize('NFC', text)
     
-    return text
+    # Ersetze bekannte problematische Zeichen (ein Durchlauf)
+    return text.translate(_UNICODE_REPLACEMENTS_TABLE)
 
 
 def sanitize_filename(title: str, max_length: int = 80) -> str:
@@ -88,31 +105,19 @@ def sanitize_filename(title: str, max_length: int = 80) -> str:
     if not title:
         return "SOMAS_Analyse"
     
-    # 1. Normalisiere Unicode (NFC)
-    filename = unicodedata.normalize('NFC', title)
-    
-    # 2. Ersetze problematische Unicode-Zeichen
-    filename = sanitize_unicode_for_export(filename)
-    
-    # 3. Entferne Emojis und andere Nicht-BMP-Zeichen (> U+FFFF)
-    # sowie Control-Zeichen (U+0000-U+001F)
-    filename = ''.join(
-        c for c in filename 
-        if ord(c) < 0x10000 and ord(c) > 0x1F
-    )
+    # 1.+2. NFC-Normalisierung und problematische Unicode-Zeichen ersetzen
+    filename = sanitize_unicode_for_export(title)
     
-    # 4. Entferne/Ersetze Zeichen, die auf Windows/Mac/Linux ungültig sind
-    # Windows: < > : " / \ | ? *
-    # Mac: : /
-    # Linux: / NUL
-    invalid_chars_pattern = r'[<>:"/\\|?*\x00-\x1f]'
-    filename = re.sub(invalid_chars_pattern, '', filename)
+    # 3.+4. Entferne Zeichen, die auf Windows/Mac/Linux ungültig sind, und
+    # Control-Zeichen (U+0000-U+001F), danach Emojis und andere
+    # Nicht-BMP-Zeichen (> U+FFFF)
+    filename = _RE_NON_BMP.sub('', filename.translate(_FILENAME_DELETE_TABLE))
     
     # 5. Ersetze mehrfache Leerzeichen durch einzelnes
-    filename = re.sub(r'\s+', ' ', filename)
+    filename = _RE_WHITESPACE.sub(' ', filename)
     
     # 6. Ersetze mehrfache Unterstriche durch einzelnen
-    filename = re.sub(r'_+', '_', filename)
+    filename = _RE_UNDERSCORES.sub('_', filename)
     
     # 7. Entferne führende/abschließende Leerzeichen, Punkte und Unterstriche
     filename = filename.strip(' ._-')
@@ -133,6 +138,20 @@ def sanitize_filename(title: str, max_length: int = 80) -> str:
     return filename
 
 
+def _write_markdown_file(output_path: str, content: str) -> None:
+    """Schreibt Markdown mit UTF-8-BOM und Unix-Zeilenenden.
+
+    Gemeinsamer Schreibpfad für export_to_markdown() und save_markdown().
+    encoding='utf-8-sig' fügt automatisch das BOM hinzu (Pandoc/Windows),
+    newline='\\n' erzwingt Unix-Zeilenenden (auch auf Windows).
+
+    Args:
+        output_path: Zielpfad der Datei.
+        content: Fertiger Markdown-Inhalt.
+    """
+    Path(output_path).write_text(content, encoding='utf-8-sig', newline='\n')
+
+
 def export_to_markdown(
     analysis_result: str,
     video_info: Optional[VideoInfo] = None,
@@ -162,6 +181,7 @@ def export_to_markdown(
     )
 
     if not output_path:
+        from datetime import datetime
         if video_info:
             base_name = sanitize_filename(video_info.title)
         else:
@@ -169,12 +189,7 @@ def export_to_markdown(
         timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
         output_path = f"{base_name}_{timestamp}.md"
 
-    # Schreibe mit UTF-8-BOM und Unix-Zeilenenden für maximale Kompatibilität
-    # encoding='utf-8-sig' fügt automatisch das BOM hinzu
-    # newline='\n' erzwingt Unix-Zeilenenden (auch auf Windows)
-    with open(output_path, 'w', encoding='utf-8-sig', newline='\n') as f:
-        f.write(content)
-
+    _write_markdown_file(output_path, content)
     return output_path
 
 
@@ -199,33 +214,32 @@ def get_markdown_content(
     Returns:
         Formatierter Markdown-String
     """
-    parts = []
+    # Direkt in einen zusammenhängenden Puffer schreiben statt Teil-Liste + join
+    buf = io.StringIO()
+    write = buf.write
 
     if video_info:
         # Sanitize den Titel für den Header
         safe_title = sanitize_unicode_for_export(video_info.title)
-        parts.append(f"# Analyse · SOMAS: {safe_title}\n")
-        parts.append(f"**Kanal:** {video_info.channel}  ")
+        write(f"# Analyse · SOMAS: {safe_title}\n\n")
+        write(f"**Kanal:** {video_info.channel}  \n")
         if video_info.duration > 0:
-            parts.append(f"**Dauer:** {video_info.duration_formatted}  ")
+            write(f"**Dauer:** {video_info.duration_formatted}  \n")
         if video_info.url:
-            parts.append(f"**URL:** {video_info.url}  ")
+            write(f"**URL:** {video_info.url}  \n")
         if model_name and provider_name:
-            parts.append(f"**Modell:** {model_name} ({provider_name})")
-        parts.append("")
-        parts.append("---\n")
+            write(f"**Modell:** {model_name} ({provider_name})\n")
+        write("\n---\n\n")
 
     # Sanitize den Analyse-Text
-    safe_analysis = sanitize_unicode_for_export(analysis_result)
-    parts.append(safe_analysis)
+    write(sanitize_unicode_for_export(analysis_result))
 
     if sources:
-        parts.append("\n\n---\n")
-        parts.append("## Quellen\n")
+        write("\n\n\n---\n\n## Quellen\n")
         for i, url in enumerate(sources, 1):
-            parts.append(f"[{i}] {url}  ")
+            write(f"\n[{i}] {url}  ")
 
-    return '\n'.join(parts)
+    return buf.getvalue()
 
 
 def save_markdown(
@@ -252,15 +266,14 @@ def save_markdown(
     safe_content = sanitize_unicode_for_export(content)
 
     if not output_path:
+        from datetime import datetime
         base_name = sanitize_filename(suggested_title) if suggested_title else "SOMAS"
         timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
         output_path = str(
             get_exports_dir() / f"{base_name}_Modellvergleich_{timestamp}.md"
         )
 
-    with open(output_path, 'w', encoding='utf-8-sig', newline='\n') as f:
-        f.write(safe_content)
-
+    _write_markdown_file(output_path, safe_content)
     return output_path
 
 
@@ -3,7 +3,10 @@
 LinkedIn unterstützt kein Markdown, aber Unicode-Zeichen für Fett/Kursiv.
 """
 
+import io
 import re
+from collections.abc import Iterable
+from functools import lru_cache
 
 # Unicode Bold (Sans-Serif Bold)
 UNICODE_BOLD = {
@@ -33,6 +36,61 @@ UNICODE_ITALIC = {
     # Umlaute haben keine Unicode-Italic-Varianten, bleiben normal
 }
 
+# Übersetzungstabellen für str.translate (einmalig beim Import erzeugt):
+# nach Codepoint indizierte Listen für den ASCII-Bereich – schneller als ein
+# Dict-Lookup; Zeichen ab U+0080 lösen IndexError aus und bleiben unverändert
+_BOLD_TABLE = [UNICODE_BOLD.get(chr(i), chr(i)) for i in range(128)]
+_ITALIC_TABLE = [UNICODE_ITALIC.get(chr(i), chr(i)) for i in range(128)]
+
+# Vorkompilierte Regex-Muster
+# Beginn des Analyse-Teils: "## FRAMING"/"### FRAMING", "FRAMING" ohne
+# Markdown oder bereits konvertiertes Unicode-Bold
+_RE_FRAMING = re.compile(r'(?m)^(?:###?\s*)?(?:FRAMING|𝗙𝗥𝗔𝗠𝗜𝗡𝗚)')
+_RE_COMPOUND_TLD = re.compile(r'\.(co|com|org|net|gov)\.[a-z]{2}$', re.IGNORECASE)
+_RE_TLD = re.compile(r'\.[a-z]{2,}$', re.IGNORECASE)
+_RE_MD_HEADER = re.compile(r'^(#{1,6})\s+(.+)$')
+# Markdown-Link [text](url) oder nackte URL; possessive Quantoren
+# (Python 3.11+) verhindern Backtracking bei unvollständigen Links
+_RE_LINK_OR_URL = re.compile(
+    r'\[(?P<md_name>[^\]]++)\]\((?P<md_url>[^)]++)\)'
+    r'|(?P<url>https?://[^\s,)]++)'
+)
+_RE_CODE = re.compile(r'`([^`]+)`')
+# Inline-Markdown in einem Durchlauf: **bold**, *italic*, _italic_, `code`
+_RE_INLINE = re.compile(
+    r'\*\*(?P<bold>[^*]+)\*\*'
+    r'|(?<!\*)\*(?P<italic>[^*]+)\*(?!\*)'
+    r'|_(?P<italic_u>[^_]+)_'
+    r'|`(?P<code>[^`]+)`'
+)
+_RE_BLANK_LINES = re.compile(r'\n{3,}')
+
+# SOMAS-Abschnittsüberschriften (mit und ohne Markdown-Hashes).
+# Die Muster sind am Zeilenanfang verankert und werden nur dort versucht –
+# ein Multi-Pattern-Automat über den ganzen Text brächte hier nichts.
+_SOMAS_HEADERS = (
+    'FRAMING', 'KERNTHESE', 'ELABORATION', 'IMPLIKATION',
+    'KRITIK', 'OFFENE_FRAGEN', 'ZITATE', 'VERBINDUNGEN',
+    'ANSCHLUSSFRAGE', 'QUICK INFO',
+)
+_SOMAS_ALTERNATION = '|'.join(_SOMAS_HEADERS)
+# Mögliche erste Zeichen einer Header-Zeile (Markdown-Hash oder Anfangs-
+# buchstabe einer SOMAS-Überschrift, beide Schreibweisen) – Schnellfilter
+# vor den Header-Regexen
+_SOMAS_LINE_STARTS = frozenset(
+    '#' + ''.join(h[0].upper() + h[0].lower() for h in _SOMAS_HEADERS)
+)
+# Zeile besteht nur aus einer SOMAS-Überschrift (z.B. "### KRITIK:");
+# umgebende Leerzeichen erlaubt, damit die Zeile nicht erst kopiert werden muss
+_RE_SOMAS_HEADER_LINE = re.compile(
+    r'^\s*(?:#{1,6}\s+)?(' + _SOMAS_ALTERNATION + r')(?:\s*:?)?\s*$',
+    re.IGNORECASE,
+)
+# SOMAS-Präfix am Zeilenanfang mit nachfolgendem Text (z.B. "KRITIK: ...")
+_RE_SOMAS_PREFIX = re.compile(
+    r'^(?:' + _SOMAS_ALTERNATION + r')\s*:\s*', re.IGNORECASE
+)
+
 
 def to_bold(text: str) -> str:
     """Konvertiert Text zu Unicode Bold.
@@ -43,7 +101,7 @@ def to_bold(text: str) -> str:
     Returns:
         Text mit Unicode Bold-Zeichen
     """
-    return ''.join(UNICODE_BOLD.get(c, c) for c in text)
+    return text.translate(_BOLD_TABLE)
 
 
 def to_italic(text: str) -> str:
@@ -55,7 +113,22 @@ def to_italic(text: str) -> str:
     Returns:
         Text mit Unicode Italic-Zeichen
     """
-    return ''.join(UNICODE_ITALIC.get(c, c) for c in text)
+    return text.translate(_ITALIC_TABLE)
+
+
+def _replace_inline(match: re.Match[str]) -> str:
+    """Callback für _RE_INLINE: wandelt genau ein Inline-Element um.
+
+    - **text** → Unicode Bold, *text*/_text_ → Unicode Italic
+      (Backticks innerhalb werden entfernt)
+    - `code` → code (Backticks entfernen, Inhalt unverändert)
+    """
+    kind = match.lastgroup
+    if kind == 'bold':
+        return to_bold(_RE_CODE.sub(r'\1', match.group('bold')))
+    if kind in ('italic', 'italic_u'):
+        return to_italic(_RE_CODE.sub(r'\1', match.group(kind)))
+    return match.group('code')
 
 
 def create_post_header(
@@ -98,17 +171,10 @@ def extract_analysis_body(text: str) -> str:
     Returns:
         Text ab FRAMING (ohne Einleitungssätze)
     """
-    # Suche nach FRAMING (mit oder ohne ### Markdown-Header)
-    framing_patterns = [
-        r'(?m)^###?\s*FRAMING',  # ### FRAMING oder # FRAMING
-        r'(?m)^FRAMING',          # FRAMING ohne Markdown
-        r'(?m)^𝗙𝗥𝗔𝗠𝗜𝗡𝗚',        # Bereits konvertiertes Unicode-Bold
-    ]
-
-    for pattern in framing_patterns:
-        match = re.search(pattern, text)
-        if match:
-            return text[match.start():]
+    # Suche nach FRAMING (mit oder ohne ### Markdown-Header), ein Durchlauf
+    match = _RE_FRAMING.search(text)
+    if match:
+        return text[match.start():]
 
     # Falls kein FRAMING gefunden, gib den ganzen Text zurück
     return text
@@ -123,14 +189,23 @@ def strip_url_protocol(url: str) -> str:
     Returns:
         URL ohne https://, http:// und www.
     """
-    url = re.sub(r'^https?://', '', url)
-    url = re.sub(r'^www\.', '', url)
+    # Feste Präfixe: Slicing statt Regex
+    if url.startswith('https://'):
+        url = url[8:]
+    elif url.startswith('http://'):
+        url = url[7:]
+    if url.startswith('www.'):
+        url = url[4:]
     return url
 
 
+@lru_cache(maxsize=512)
 def extract_domain_name(url: str) -> str:
     """Extrahiert den Domain-Namen ohne Protokoll, www und TLD.
 
+    Gecacht, da dieselben URLs innerhalb eines Posts und über mehrere
+    Analysen hinweg wiederholt zitiert werden.
+
     Args:
         url: Vollständige URL oder Domain
 
@@ -139,17 +214,95 @@ def extract_domain_name(url: str) -> str:
     """
     domain = strip_url_protocol(url).split('/')[0]
     # Compound-TLDs entfernen (.co.uk, .com.au, .org.uk, etc.)
-    stripped = re.sub(
-        r'\.(co|com|org|net|gov)\.[a-z]{2}$', '', domain, flags=re.IGNORECASE
-    )
+    stripped = _RE_COMPOUND_TLD.sub('', domain)
     if stripped != domain:
         domain = stripped
     else:
         # Einfache TLD entfernen (.com, .org, .net, .de, etc.)
-        domain = re.sub(r'\.[a-z]{2,}$', '', domain, flags=re.IGNORECASE)
+        domain = _RE_TLD.sub('', domain)
     return domain
 
 
+class _SourceCollector:
+    """Sammelt Quellen eines Posts und vergibt Fußnoten-Nummern.
+
+    Spaltenweise Ablage; Fußnote N liegt an Index N-1, da die Nummern
+    lückenlos ab 1 vergeben werden. ``domain_numbers`` gruppiert die
+    Nummern bereits beim Sammeln nach Domain.
+    """
+
+    __slots__ = ("names", "urls", "domain_numbers", "counter")
+
+    def __init__(self) -> None:
+        self.names: list[str] = []
+        self.urls: list[str] = []
+        self.domain_numbers: dict[str, list[int]] = {}  # Domain → Nummern
+        self.counter = 0
+
+    def add(self, name: str, url: str) -> str:
+        """Vergibt die nächste Fußnoten-Nummer und merkt die Quelle.
+
+        Args:
+            name: Anzeigename (leer = Domain-Name).
+            url: Quell-URL.
+
+        Returns:
+            Fußnoten-Marker "[N]".
+        """
+        self.counter += 1
+        domain = extract_domain_name(url)
+        self.names.append(name or domain)
+        self.urls.append(url)
+        self.domain_numbers.setdefault(domain, []).append(self.counter)
+        return f"[{self.counter}]"
+
+    def collect_link(self, match: re.Match[str]) -> str:
+        """Callback für _RE_LINK_OR_URL: [text](url) → "text [N]", URL → "[N]"."""
+        if match.group('md_url') is not None:
+            name = match.group('md_name')
+            return f"{name} {self.add(name, match.group('md_url'))}"
+        return self.add("", match.group('url').rstrip('.,!?;:'))
+
+
+@lru_cache(maxsize=64)
+def _domain_ref_pattern(domains: tuple[str, ...]) -> re.Pattern[str]:
+    """Kompiliert "domain [N]"-Muster für eine Domain-Menge (gecacht).
+
+    Args:
+        domains: Domains, längste zuerst (Alternation bevorzugt so den
+            längsten Treffer).
+
+    Returns:
+        Muster, das eine Folge von Domain-Namen vor einem [N]-Marker
+        erfasst; Gruppe 1 ist der Marker.
+    """
+    alternation = "|".join(re.escape(d) for d in domains)
+    # "domainname [N]" → "[N]" und "domainname. [N]" → "[N]"
+    return re.compile(rf'(?:\b(?:{alternation})\.?\s*)+(\[\d+\])', re.IGNORECASE)
+
+
+def _strip_domains_before_refs(text: str, domains: Iterable[str]) -> str:
+    """Entfernt Domain-Namen direkt vor [N]-Markern in einem Durchlauf.
+
+    Nur Domains, die per Substring-Suche überhaupt im Text vorkommen, gehen
+    in das Muster ein – meist keine, dann entfällt der Regex-Lauf ganz.
+
+    Args:
+        text: Formatierter Post-Text.
+        domains: Domain-Namen der gesammelten Quellen.
+
+    Returns:
+        Text ohne vorangestellte Domain-Namen vor den Markern.
+    """
+    lower_text = text.lower()
+    present = sorted(
+        (d for d in domains if d.lower() in lower_text), key=len, reverse=True
+    )
+    if not present:
+        return text
+    return _domain_ref_pattern(tuple(present)).sub(r'\1', text)
+
+
 def format_for_linkedin(
     text: str, video_title: str = "", video_channel: str = "",
     model_name: str = "", provider_name: str = "",
@@ -183,90 +336,73 @@ def format_for_linkedin(
     # Nur den Analyse-Teil ab FRAMING extrahieren (ohne Einleitung)
     analysis_text = extract_analysis_body(text)
 
-    lines = analysis_text.split('\n')
-    result_lines: list[str] = []
-    collected_sources: list[tuple[int, str, str, str]] = []  # (nr, name, url, domain)
-    footnote_counter = 0
+    # Ausgabe direkt in einen Puffer schreiben statt Zeilenliste + join
+    buf = io.StringIO()
+    write = buf.write
+    # True, wenn die zuletzt geschriebene Zeile Text enthält (dann bekommt
+    # ein entfernter Header eine Leerzeile als Trenner)
+    last_has_text = False
+    # Einmal pro Text prüfen, ob überhaupt Links bzw. Inline-Markup
+    # vorkommen – reiner Fließtext überspringt dann die Zeilenprüfungen
+    has_links = 'http' in analysis_text or '](' in analysis_text
+    has_inline = any(marker in analysis_text for marker in '*_`')
+
+    sources = _SourceCollector()
+    collect_link = sources.collect_link  # einmal binden, pro Treffer genutzt
 
     # API-Citations vorbelegen (z.B. Perplexity gibt URLs separat zurück,
     # der Text enthält bereits [1][2]-Marker ohne die eigentlichen URLs)
     if citations:
-        for i, url in enumerate(citations, start=1):
-            domain = extract_domain_name(url)
-            collected_sources.append((i, domain, url, domain))
-            footnote_counter = i
-
-    # SOMAS-Abschnittsüberschriften (mit und ohne Markdown-Hashes)
-    somas_headers = [
-        'FRAMING', 'KERNTHESE', 'ELABORATION', 'IMPLIKATION',
-        'KRITIK', 'OFFENE_FRAGEN', 'ZITATE', 'VERBINDUNGEN',
-        'ANSCHLUSSFRAGE', 'QUICK INFO'
-    ]
-    somas_pattern = r'^(?:#{1,6}\s+)?(' + '|'.join(somas_headers) + r')(?:\s*:?)?\s*$'
-
-    for line in lines:
-        # SOMAS-Überschriften → Leerzeile (Abschnitt visuell trennen)
-        if re.match(somas_pattern, line.strip(), re.IGNORECASE):
-            # Füge Leerzeile als Trenner hinzu (falls nicht am Anfang)
-            if result_lines and result_lines[-1].strip():
-                result_lines.append('')
-            continue
-
-        # Andere Markdown-Headers: ### HEADING → auch entfernen
-        header_match = re.match(r'^(#{1,6})\s+(.+)$', line)
-        if header_match:
-            if result_lines and result_lines[-1].strip():
-                result_lines.append('')
+        for url in citations:
+            sources.add("", url)
+
+    for line in analysis_text.split('\n'):
+        # Leerzeilen unverändert übernehmen (keine Regex-/Substring-Prüfungen)
+        if not line:
+            write('\n')
+            last_has_text = False
             continue
 
-        # SOMAS-Header am Zeilenanfang entfernen (auch mit nachfolgendem Text)
-        for header in somas_headers:
-            line = re.sub(rf'^{header}\s*:\s*', '', line, flags=re.IGNORECASE)
-
-        # Markdown Links: [text](url) → Text [N]
-        def collect_markdown_link(match: re.Match[str]) -> str:
-            nonlocal footnote_counter
-            name = match.group(1)
-            url = match.group(2)
-            footnote_counter += 1
-            domain = extract_domain_name(url)
-            collected_sources.append((footnote_counter, name, url, domain))
-            return f"{name} [{footnote_counter}]"
-        line = re.sub(r'\[([^\]]+)\]\(([^)]+)\)', collect_markdown_link, line)
-
-        # Bare URLs im Text: durch [N] ersetzen
-        def collect_bare_url(match: re.Match[str]) -> str:
-            nonlocal footnote_counter
-            url = match.group(0).rstrip('.,!?;:')
-            domain = extract_domain_name(url)
-            footnote_counter += 1
-            collected_sources.append((footnote_counter, domain, url, domain))
-            return f"[{footnote_counter}]"
-        line = re.sub(r'https?://[^\s,)]+', collect_bare_url, line)
-
-        # Code blocks: `code` → code (einfach Backticks entfernen)
-        line = re.sub(r'`([^`]+)`', r'\1', line)
-
-        # Bold: **text** → Unicode Bold
-        def bold_replace(match):
-            return to_bold(match.group(1))
-        line = re.sub(r'\*\*([^*]+)\*\*', bold_replace, line)
-
-        # Italic: *text* oder _text_ → Unicode Italic
-        def italic_replace(match):
-            return to_italic(match.group(1))
-        line = re.sub(r'(?<!\*)\*([^*]+)\*(?!\*)', italic_replace, line)
-        line = re.sub(r'_([^_]+)_', italic_replace, line)
-
-        # Bullet points: - item → • item
-        line = re.sub(r'^(\s*)-\s+', r'\1• ', line)
-
-        result_lines.append(line)
-
-    formatted_text = '\n'.join(result_lines)
+        # Header-Regexe nur für Zeilen, die überhaupt so beginnen können
+        first = line[:1]
+        if first in _SOMAS_LINE_STARTS or first.isspace():
+            # SOMAS-Überschriften und andere Markdown-Headers (### HEADING)
+            # → Leerzeile (Abschnitt visuell trennen)
+            if _RE_SOMAS_HEADER_LINE.match(line) or _RE_MD_HEADER.match(line):
+                # Füge Leerzeile als Trenner hinzu (falls nicht am Anfang)
+                if last_has_text:
+                    write('\n')
+                    last_has_text = False
+                continue
+
+            # SOMAS-Header am Zeilenanfang entfernen (auch mit nachfolgendem Text)
+            line = _RE_SOMAS_PREFIX.sub('', line)
+
+        # Markdown-Links und nackte URLs → [N] (ein Durchlauf, Dokumentreihenfolge).
+        # Bewusst vor und getrennt von _RE_INLINE: sonst würde z.B.
+        # "*siehe [x](url)*" als Kursiv-Span samt Link verschluckt
+        # Substring-Vorprüfungen sparen den Regex-Aufruf für Zeilen ohne Markup
+        if has_links and ('http' in line or '](' in line):
+            line = _RE_LINK_OR_URL.sub(collect_link, line)
+
+        # "- " Bullets am Zeilenanfang → "• " (Einrückung bleibt erhalten)
+        if '-' in line:
+            body = line.lstrip()
+            if body[:1] == '-' and body[1:2].isspace():
+                line = f"{line[:len(line) - len(body)]}• {body[1:].lstrip()}"
+
+        # Inline-Markdown: **bold**, *italic*/_italic_, `code`
+        if has_inline and ('*' in line or '_' in line or '`' in line):
+            line = _RE_INLINE.sub(_replace_inline, line)
+
+        write(line)
+        write('\n')
+        last_has_text = bool(line) and not line.isspace()
+
+    formatted_text = buf.getvalue()
 
     # Mehrfache Leerzeilen auf eine reduzieren
-    formatted_text = re.sub(r'\n{3,}', '\n\n', formatted_text)
+    formatted_text = _RE_BLANK_LINES.sub('\n\n', formatted_text)
 
     # Führende/trailing Leerzeilen entfernen
     formatted_text = formatted_text.strip()
@@ -279,38 +415,26 @@ def format_for_linkedin(
         formatted_text = header + formatted_text
 
     # Domain-Namen vor [N]-Markern entfernen (AI gibt oft "domainname URL" aus)
-    if collected_sources:
-        for _, _, _url, domain in collected_sources:
-            # "domainname [N]" → "[N]" und "domainname. [N]" → "[N]"
-            formatted_text = re.sub(
-                rf'\b{re.escape(domain)}\.?\s*(\[\d+\])',
-                r'\1',
-                formatted_text,
-                flags=re.IGNORECASE
-            )
+    domain_numbers = sources.domain_numbers
+    if domain_numbers:
+        formatted_text = _strip_domains_before_refs(formatted_text, domain_numbers)
 
     # Quellenblock am Ende: gleiche Domains zusammenfassen
-    if collected_sources:
-        # Gruppiere Fußnoten-Nummern nach Domain
-        domain_numbers: dict[str, list[int]] = {}
-        for number, _name, _url, domain in collected_sources:
-            if domain not in domain_numbers:
-                domain_numbers[domain] = []
-            domain_numbers[domain].append(number)
-
+    # (Fußnoten-Nummern sind bereits beim Sammeln nach Domain gruppiert)
+    if domain_numbers:
         # Formatiere: "1,6: timesofisrael" oder "2: cnn"
         source_parts: list[str] = []
         for domain, numbers in domain_numbers.items():
-            nums = ",".join(str(n) for n in numbers)
+            nums = ",".join(map(str, numbers))
             source_parts.append(f"{nums}: {domain}")
 
-        formatted_text += "\n\nQuellen: " + " | ".join(source_parts)
+        formatted_text = f"{formatted_text}\n\nQuellen: {' | '.join(source_parts)}"
 
     # Detail-Quellen: nummerierte Liste mit vollen URLs
     detailed_sources = ""
-    if collected_sources:
+    if sources.urls:
         detail_lines: list[str] = ["Quellenangaben im Detail:"]
-        for number, name, url, _domain in collected_sources:
+        for number, (name, url) in enumerate(zip(sources.names, sources.urls), start=1):
             detail_lines.append(f"[{number}] {name} - {url}")
         detailed_sources = "\n".join(detail_lines)
 
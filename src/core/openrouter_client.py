@@ -6,14 +6,21 @@ Unterstützt dynamisches Laden der Modell-Liste via /models Endpoint.
 """
 
 import logging
-from typing import ClassVar, Optional
+import time
+from typing import ClassVar
 
+import orjson
 import requests
 
-from .api_client import APIResponse, APIStatus, LLMClient
+from .api_client import APIResponse, APIStatus, LLMClient, get_http_session
 
 logger = logging.getLogger(__name__)
 
+# Prozessweiter Cache der /models-Liste über Client-Instanzen hinweg:
+# api_key → (time.monotonic() beim Laden, Modelle)
+_models_cache: dict[str, tuple[float, list[dict]]] = {}
+_MODELS_CACHE_TTL_SECONDS = 3600.0
+
 
 class OpenRouterClient(LLMClient):
     """OpenRouter API Client."""
@@ -78,26 +85,27 @@ class OpenRouterClient(LLMClient):
             "Content-Type": "application/json",
             "X-Title": "SOMAS Prompt Generator",
         }
-        self._cached_models: Optional[list[dict]] = None
 
     def get_available_models(self) -> list[dict]:
         """Gibt Liste der verfügbaren Modelle zurück.
 
         Versucht dynamisch von /models zu laden, fällt auf
-        FALLBACK_MODELS zurück bei Fehler.
+        FALLBACK_MODELS zurück bei Fehler. Erfolgreich geladene Listen
+        werden pro API-Key eine Stunde lang prozessweit gecacht.
         """
-        if self._cached_models is not None:
-            return self._cached_models
+        cached = _models_cache.get(self.api_key)
+        if cached is not None and time.monotonic() - cached[0] < _MODELS_CACHE_TTL_SECONDS:
+            return cached[1]
 
         try:
-            response = requests.get(
+            response = get_http_session().get(
                 f"{self.BASE_URL}/models",
                 headers={"Authorization": f"Bearer {self.api_key}"},
                 timeout=15,
             )
 
             if response.status_code == 200:
-                data = response.json()
+                data = orjson.loads(response.content)
                 models = []
                 for m in data.get("data", []):
                     model_id = m.get("id", "")
@@ -113,7 +121,7 @@ class OpenRouterClient(LLMClient):
                     })
 
                 if models:
-                    self._cached_models = models
+                    _models_cache[self.api_key] = (time.monotonic(), models)
                     logger.info(f"OpenRouter: {len(models)} Modelle geladen")
                     return models
 
@@ -136,7 +144,7 @@ class OpenRouterClient(LLMClient):
         logger.info(f"OpenRouter API-Call: model={model}, prompt_len={len(prompt)}")
 
         try:
-            response = requests.post(
+            response = get_http_session().post(
                 f"{self.BASE_URL}/chat/completions",
                 headers=self.headers,
                 json={
@@ -147,7 +155,7 @@ class OpenRouterClient(LLMClient):
             )
 
             if response.status_code == 200:
-                data = response.json()
+                data = orjson.loads(response.content)
                 try:
                     choice = data["choices"][0]
                     message = choice.get("message", {}) or {}
@@ -223,7 +231,7 @@ class OpenRouterClient(LLMClient):
         Ruft /models Endpoint auf, da dies keinen Credit verbraucht.
         """
         try:
-            response = requests.get(
+            response = get_http_session().get(
                 f"{self.BASE_URL}/models",
                 headers={"Authorization": f"Bearer {self.api_key}"},
                 timeout=15,
@@ -7,9 +7,10 @@ Perplexity hat keinen /models Endpoint, daher sind die Modelle hardcoded.
 import logging
 from typing import ClassVar
 
+import orjson
 import requests
 
-from .api_client import APIResponse, APIStatus, LLMClient
+from .api_client import APIResponse, APIStatus, LLMClient, get_http_session
 
 logger = logging.getLogger(__name__)
 
@@ -72,7 +73,7 @@ class PerplexityClient(LLMClient):
         logger.info(f"Perplexity API-Call: model={model}, prompt_len={len(prompt)}")
 
         try:
-            response = requests.post(
+            response = get_http_session().post(
                 f"{self.BASE_URL}/chat/completions",
                 headers=self.headers,
                 json={
@@ -83,7 +84,7 @@ class PerplexityClient(LLMClient):
             )
 
             if response.status_code == 200:
-                data = response.json()
+                data = orjson.loads(response.content)
                 try:
                     choice = data["choices"][0]
                     message = choice.get("message", {}) or {}
@@ -161,7 +162,7 @@ class PerplexityClient(LLMClient):
         Sendet einen minimalen Request an die API.
         """
         try:
-            response = requests.post(
+            response = get_http_session().post(
                 f"{self.BASE_URL}/chat/completions",
                 headers=self.headers,
                 json={
@@ -8,20 +8,35 @@ Changelog v0.5.1:
 - Neues Feld requires_web_search im PromptPreset für Web-Search-abhängige Presets
 """
 
-import json
+import logging
 import re
+import threading
+import time
+from functools import lru_cache
 from pathlib import Path
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, fields
 from typing import Dict, List, Optional
 
-from jinja2 import Environment, FileSystemLoader
+import orjson
+from jinja2 import (
+    BytecodeCache,
+    Environment,
+    FileSystemBytecodeCache,
+    FileSystemLoader,
+)
 
 from src.config.defaults import VideoInfo, SomasConfig
 
+logger = logging.getLogger(__name__)
 
-@dataclass
+
+@dataclass(frozen=True, slots=True)
 class PromptPreset:
-    """Repräsentiert ein Prompt-Preset."""
+    """Repräsentiert ein Prompt-Preset.
+
+    Unveränderlich und hashbar (recommended_models als Tupel), damit die
+    Instanzen gefahrlos aus dem Preset-Cache geteilt werden können.
+    """
     id: str
     name: str
     description: str
@@ -31,7 +46,7 @@ class PromptPreset:
     system_prompt: str
     template_file: str
     # Neu in v0.3.1:
-    recommended_models: Optional[List[str]] = None
+    recommended_models: Optional[tuple[str, ...]] = None
     show_model_hint: bool = False
     model_hint_message: Optional[str] = None
     # Neu in v0.4.2: Preset-Template enthält eigene {{ transcript }}-Einbettung
@@ -40,94 +55,134 @@ class PromptPreset:
     requires_web_search: bool = False
     # Neu in v0.6.0: Default-Perspektive für Analysehaltung
     perspective: str = "neutral"
+    # Anzeige-Werte, einmalig in __post_init__ berechnet (Preset ist unveränderlich)
+    reading_time_display: str = field(init=False, repr=False, compare=False)
+    max_chars_display: str = field(init=False, repr=False, compare=False)
+    is_unlimited: bool = field(init=False, repr=False, compare=False)
 
-    @property
-    def reading_time_display(self) -> str:
-        """Formatiert die Lesezeit für die Anzeige."""
+    def __post_init__(self) -> None:
+        """Berechnet die Anzeige-Strings für Lesezeit und Zeichenbegrenzung."""
         if self.reading_time_seconds == 0:
-            return "variabel"
-        if self.reading_time_seconds < 60:
-            return f"~{self.reading_time_seconds} Sek."
-        minutes = self.reading_time_seconds // 60
-        return f"~{minutes} Min."
-    
-    @property
-    def max_chars_display(self) -> str:
-        """Formatiert die Zeichenbegrenzung für die Anzeige."""
+            reading_time = "variabel"
+        elif self.reading_time_seconds < 60:
+            reading_time = f"~{self.reading_time_seconds} Sek."
+        else:
+            reading_time = f"~{self.reading_time_seconds // 60} Min."
+
         if self.max_chars == 0:
-            return "unbegrenzt"
-        return f"max. {self.max_chars:,}".replace(',', '.')
-    
-    @property
-    def is_unlimited(self) -> bool:
-        """Prüft ob das Preset keine Zeichenbegrenzung hat."""
-        return self.max_chars == 0
-    
+            max_chars = "unbegrenzt"
+        else:
+            max_chars = f"max. {self.max_chars:,}".replace(',', '.')
+
+        # frozen: Zuweisung nur über object.__setattr__
+        object.__setattr__(self, "reading_time_display", reading_time)
+        object.__setattr__(self, "max_chars_display", max_chars)
+        object.__setattr__(self, "is_unlimited", self.max_chars == 0)
+
     @property
     def has_model_recommendation(self) -> bool:
         """Prüft ob das Preset Modellempfehlungen hat."""
         return self.recommended_models is not None and len(self.recommended_models) > 0
 
 
+@lru_cache(maxsize=1)
 def get_config_dir() -> Path:
     """Gibt den Pfad zum Config-Verzeichnis zurück."""
     return Path(__file__).parent.parent / "config"
 
 
-def load_presets() -> Dict[str, PromptPreset]:
-    """Lädt alle Prompt-Presets aus der JSON-Konfiguration.
+# Feldnamen von PromptPreset (Filter für die JSON-Keys beim Laden)
+_PRESET_FIELDS = frozenset(f.name for f in fields(PromptPreset) if f.init)
+
+# In-Memory-Cache für prompt_presets.json, invalidiert über die mtime:
+# (mtime_ns, Presets nach Key, Index nach Name, Index nach ID)
+_presets_cache: tuple[
+    int, Dict[str, PromptPreset], Dict[str, PromptPreset], Dict[str, PromptPreset]
+] | None = None
+# Zeitpunkt (time.monotonic) der letzten mtime-Prüfung; innerhalb des
+# Intervalls wird der Cache ohne stat() ausgeliefert
+_presets_checked_at = 0.0
+_PRESETS_RECHECK_SECONDS = 2.0
+
+
+def _load_presets_cached() -> tuple[
+    Dict[str, PromptPreset], Dict[str, PromptPreset], Dict[str, PromptPreset]
+]:
+    """Liest prompt_presets.json höchstens einmal pro Dateiänderung.
+
+    Die mtime wird höchstens alle _PRESETS_RECHECK_SECONDS geprüft;
+    Änderungen an der Datei werden also mit bis zu 2 s Verzögerung sichtbar.
+
+    Name- und ID-Index werden beim Laden mit aufgebaut; bei doppelten
+    Namen/IDs gewinnt wie bisher das erste Preset.
 
     Returns:
-        Dictionary mit Preset-Key und PromptPreset-Objekten
+        Tupel aus Presets nach Key, Index nach Name und Index nach ID.
     """
+    global _presets_cache, _presets_checked_at
+
+    now = time.monotonic()
+    if (
+        _presets_cache is not None
+        and now - _presets_checked_at < _PRESETS_RECHECK_SECONDS
+    ):
+        return _presets_cache[1], _presets_cache[2], _presets_cache[3]
+
     config_path = get_config_dir() / "prompt_presets.json"
-    with open(config_path, "r", encoding="utf-8") as f:
-        data = json.load(f)
+    mtime = config_path.stat().st_mtime_ns
+    _presets_checked_at = now
+    if _presets_cache is not None and _presets_cache[0] == mtime:
+        return _presets_cache[1], _presets_cache[2], _presets_cache[3]
+
+    data = orjson.loads(config_path.read_bytes())
 
     presets = {}
     for key, preset_data in data["presets"].items():
-        presets[key] = PromptPreset(
-            id=preset_data["id"],
-            name=preset_data["name"],
-            description=preset_data["description"],
-            max_chars=preset_data["max_chars"],
-            sentences_per_section=preset_data["sentences_per_section"],
-            reading_time_seconds=preset_data["reading_time_seconds"],
-            system_prompt=preset_data["system_prompt"],
-            template_file=preset_data["template_file"],
-            # Neue Felder mit Defaults für Rückwärtskompatibilität
-            recommended_models=preset_data.get("recommended_models"),
-            show_model_hint=preset_data.get("show_model_hint", False),
-            model_hint_message=preset_data.get("model_hint_message"),
-            transcript_aware=preset_data.get("transcript_aware", False),
-            requires_web_search=preset_data.get("requires_web_search", False),
-            perspective=preset_data.get("perspective", "neutral"),
-        )
-    return presets
+        # Unbekannte Keys ignorieren (vorwärtskompatibel), fehlende optionale
+        # Felder über die Dataclass-Defaults (rückwärtskompatibel)
+        kwargs = {k: v for k, v in preset_data.items() if k in _PRESET_FIELDS}
+        if kwargs.get("recommended_models") is not None:
+            kwargs["recommended_models"] = tuple(kwargs["recommended_models"])
+        presets[key] = PromptPreset(**kwargs)
+
+    by_name: Dict[str, PromptPreset] = {}
+    by_id: Dict[str, PromptPreset] = {}
+    for preset in presets.values():
+        by_name.setdefault(preset.name, preset)
+        by_id.setdefault(preset.id, preset)
+
+    _presets_cache = (mtime, presets, by_name, by_id)
+    return presets, by_name, by_id
+
+
+def load_presets() -> Dict[str, PromptPreset]:
+    """Lädt alle Prompt-Presets aus der JSON-Konfiguration.
+
+    Die Datei wird nur bei geänderter mtime neu gelesen und geparst.
+
+    Returns:
+        Dictionary mit Preset-Key und PromptPreset-Objekten
+    """
+    presets, _, _ = _load_presets_cached()
+    return dict(presets)
 
 
 def get_preset_names() -> List[str]:
     """Gibt eine Liste aller verfügbaren Preset-Namen zurück."""
-    presets = load_presets()
+    presets, _, _ = _load_presets_cached()
     return [p.name for p in presets.values()]
 
 
 def get_preset_by_name(name: str) -> Optional[PromptPreset]:
     """Findet ein Preset anhand seines Anzeigenamens."""
-    presets = load_presets()
-    for preset in presets.values():
-        if preset.name == name:
-            return preset
-    return None
+    _, by_name, _ = _load_presets_cached()
+    return by_name.get(name)
 
 
 def get_preset_by_id(preset_id: str) -> Optional[PromptPreset]:
     """Findet ein Preset anhand seiner ID."""
-    presets = load_presets()
-    for preset in presets.values():
-        if preset.id == preset_id:
-            return preset
-    return None
+    _, _, by_id = _load_presets_cached()
+    return by_id.get(preset_id)
 
 
 # Perspektive-Texte (v0.6.0)
@@ -210,6 +265,7 @@ def get_anti_monotony_hint(
     )
 
 
+@lru_cache(maxsize=1)
 def get_template_dir() -> Path:
     """Gibt den Pfad zum Templates-Verzeichnis zurück."""
     # Vom src/core/ aus zwei Ebenen hoch, dann in templates/
@@ -217,6 +273,75 @@ def get_template_dir() -> Path:
     return base_dir / "templates"
 
 
+def _get_bytecode_cache() -> Optional[BytecodeCache]:
+    """Erzeugt den Jinja2-Bytecode-Cache auf der Platte.
+
+    Ohne explizites Verzeichnis legt Jinja2 ein benutzereigenes
+    Verzeichnis (Rechte 0700, Eigentümer geprüft) im Temp-Verzeichnis an.
+    Ein fest vorgegebener, gemeinsamer Pfad wäre unsicher: fremde Nutzer
+    könnten dort präparierte .cache-Dateien ablegen, die Jinja2 als Code lädt.
+
+    Returns:
+        FileSystemBytecodeCache oder None, wenn das Verzeichnis nicht
+        sicher angelegt werden kann (Templates werden dann nur im RAM gecacht).
+    """
+    try:
+        return FileSystemBytecodeCache()
+    except (OSError, RuntimeError) as e:
+        logger.debug(f"Kein Bytecode-Cache für Templates: {e}")
+        return None
+
+
+@lru_cache(maxsize=1)
+def get_template_env() -> Environment:
+    """Gibt die geteilte Jinja2-Umgebung für die Templates zurück.
+
+    Die Umgebung wird einmalig erzeugt; Jinja2 hält darin die kompilierten
+    Templates vor, sodass sie nicht bei jedem Prompt neu geparst werden.
+    Die Templates werden mit der App ausgeliefert und zur Laufzeit nicht
+    geändert, daher ohne auto_reload (kein stat() pro get_template()).
+    Der Bytecode-Cache spart das Kompilieren beim nächsten Programmstart;
+    Jinja2 verwirft Einträge selbst, wenn sich der Template-Quelltext ändert.
+
+    Returns:
+        Jinja2-Environment über dem Templates-Verzeichnis.
+    """
+    return Environment(
+        loader=FileSystemLoader(get_template_dir()),
+        trim_blocks=True,
+        lstrip_blocks=True,
+        auto_reload=False,
+        cache_size=50,
+        bytecode_cache=_get_bytecode_cache(),
+    )
+
+
+def warm_template_cache(presets: Dict[str, PromptPreset]) -> None:
+    """Kompiliert die von Presets genutzten Templates im Hintergrund vor.
+
+    Templates bleiben lazy: der Start wartet nicht darauf, und der erste
+    Prompt-Aufbau trifft danach meist schon den Template-Cache. Fehler
+    (z.B. fehlende Template-Datei) fallen erst beim echten Rendern auf.
+
+    Args:
+        presets: Geladene Presets (von load_presets()).
+    """
+    template_files = {"somas_prompt.txt", "somas_prompt_transcript.txt"}
+    template_files.update(p.template_file for p in presets.values())
+
+    # Umgebung im aufrufenden Thread erzeugen (lru_cache ist nicht atomar)
+    env = get_template_env()
+
+    def _warm() -> None:
+        for name in sorted(template_files):
+            try:
+                env.get_template(name)
+            except Exception as e:
+                logger.debug(f"Template-Vorwärmen fehlgeschlagen ({name}): {e}")
+
+    threading.Thread(target=_warm, name="somas_template_warmup", daemon=True).start()
+
+
 def load_template(template_name: str = "somas_prompt.txt") -> str:
     """Lädt ein Template aus dem Templates-Verzeichnis.
 
@@ -264,6 +389,75 @@ def _apply_custom_overrides(
     return rendered
 
 
+def _resolve_preset_settings(
+    preset_name: Optional[str], config: SomasConfig
+) -> tuple[Optional[PromptPreset], int]:
+    """Ermittelt Preset und effektive Satzanzahl für die build_prompt*-Funktionen.
+
+    Args:
+        preset_name: Name des Presets oder None.
+        config: SOMAS-Konfiguration als Fallback.
+
+    Returns:
+        Tupel aus Preset (None wenn unbekannt/nicht gesetzt) und
+        sentences_per_section (Preset-Wert, falls > 0, sonst aus config).
+    """
+    if not preset_name:
+        return None, config.sentences_per_section
+    _, by_name, _ = _load_presets_cached()
+    preset = by_name.get(preset_name)
+    # Bei Research-Preset (sentences_per_section=0) gilt der Config-Wert
+    if preset and preset.sentences_per_section > 0:
+        return preset, preset.sentences_per_section
+    return preset, config.sentences_per_section
+
+
+def _clean_questions(questions: str) -> str:
+    """Entfernt umgebenden Whitespace der Anschlussfragen.
+
+    Ohne Whitespace an den Rändern (Normalfall) wird der String unverändert
+    zurückgegeben, statt per strip() eine Kopie anzulegen.
+    """
+    if not questions:
+        return ""
+    if questions[0].isspace() or questions[-1].isspace():
+        return questions.strip()
+    return questions
+
+
+def _shared_render_context(
+    config: SomasConfig,
+    preset: Optional[PromptPreset],
+    sentences_per_section: int,
+    questions: str,
+    perspective: Optional[str],
+    anti_monotony_hint: str,
+    custom_module: Optional[str],
+) -> dict:
+    """Baut die Template-Variablen, die alle SOMAS-Templates gemeinsam haben.
+
+    Als Dict-Literal statt Keyword-Aufruf; die Aufrufer ergänzen nur noch
+    ihre quellenspezifischen Variablen.
+
+    Returns:
+        Render-Kontext für template.render().
+    """
+    # Perspektive: expliziter Override > Preset-Default > "neutral"
+    effective_perspective = perspective or (preset.perspective if preset else "neutral")
+    return {
+        "depth": config.depth,
+        "depth_description": config.depth_description,
+        "sentences_per_section": sentences_per_section,
+        "language": config.language,
+        "time_range": config.time_range,
+        "max_chars": preset.max_chars if preset else 0,
+        "questions": _clean_questions(questions),
+        "perspective_text": get_perspective_text(effective_perspective),
+        # Anti-Monotonie wird durch custom_module überschrieben
+        "anti_monotony_hint": "" if custom_module else anti_monotony_hint,
+    }
+
+
 def build_prompt(
     video_info: VideoInfo,
     config: SomasConfig,
@@ -273,6 +467,8 @@ def build_prompt(
     anti_monotony_hint: str = "",
     custom_system_prompt: Optional[str] = None,
     custom_module: Optional[str] = None,
+    *,
+    env: Optional[Environment] = None,
 ) -> str:
     """Generiert einen SOMAS-Prompt aus Template und Konfiguration.
 
@@ -285,58 +481,30 @@ def build_prompt(
         anti_monotony_hint: Optionaler Hinweis zur Modul-Variation.
         custom_system_prompt: Optionaler System-Prompt-Override aus PromptEditDialog.
         custom_module: Optionales erzwungenes Modul aus PromptEditDialog.
+        env: Optionale Jinja2-Umgebung (Default: get_template_env()), z.B.
+            einmal geholt für Aufrufe in einer Schleife.
 
     Returns:
         Fertig gerenderte Prompt-Zeichenkette
     """
-    template_dir = get_template_dir()
-    env = Environment(
-        loader=FileSystemLoader(template_dir),
-        trim_blocks=True,
-        lstrip_blocks=True,
-    )
-
-    # Wähle Template basierend auf Preset
-    preset = None
-    if preset_name:
-        preset = get_preset_by_name(preset_name)
-        if preset:
-            template_file = preset.template_file
-        else:
-            template_file = "somas_prompt.txt"
-    else:
-        template_file = "somas_prompt.txt"
+    if env is None:
+        env = get_template_env()
 
-    # Verwende sentences_per_section vom Preset wenn vorhanden
-    # Bei Research-Preset (sentences_per_section=0) wird dieser Wert nicht verwendet
-    sentences_per_section = (
-        preset.sentences_per_section if preset and preset.sentences_per_section > 0
-        else config.sentences_per_section
-    )
+    preset, sentences_per_section = _resolve_preset_settings(preset_name, config)
 
+    # Wähle Template basierend auf Preset
+    template_file = preset.template_file if preset else "somas_prompt.txt"
     template = env.get_template(template_file)
 
-    # Perspektive: expliziter Override > Preset-Default > "neutral"
-    effective_perspective = perspective or (preset.perspective if preset else "neutral")
-    perspective_text = get_perspective_text(effective_perspective)
-
-    # Anti-Monotonie wird durch custom_module überschrieben
-    effective_hint = "" if custom_module else anti_monotony_hint
-
-    rendered = template.render(
-        video_title=video_info.title,
-        channel_name=video_info.channel,
-        video_url=video_info.url,
-        depth=config.depth,
-        depth_description=config.depth_description,
-        sentences_per_section=sentences_per_section,
-        language=config.language,
-        time_range=config.time_range,
-        max_chars=preset.max_chars if preset else 0,
-        questions=questions.strip() if questions else "",
-        perspective_text=perspective_text,
-        anti_monotony_hint=effective_hint,
+    context = _shared_render_context(
+        config, preset, sentences_per_section, questions,
+        perspective, anti_monotony_hint, custom_module,
     )
+    context["video_title"] = video_info.title
+    context["channel_name"] = video_info.channel
+    context["video_url"] = video_info.url
+
+    rendered = template.render(context)
 
     return _apply_custom_overrides(rendered, custom_system_prompt, custom_module)
 
@@ -354,6 +522,8 @@ def build_prompt_from_transcript(
     anti_monotony_hint: str = "",
     custom_system_prompt: Optional[str] = None,
     custom_module: Optional[str] = None,
+    *,
+    env: Optional[Environment] = None,
 ) -> str:
     """Generiert einen SOMAS-Prompt aus manuellem Transkript.
 
@@ -374,24 +544,16 @@ def build_prompt_from_transcript(
         anti_monotony_hint: Optionaler Hinweis zur Modul-Variation.
         custom_system_prompt: Optionaler System-Prompt-Override aus PromptEditDialog.
         custom_module: Optionales erzwungenes Modul aus PromptEditDialog.
+        env: Optionale Jinja2-Umgebung (Default: get_template_env()), z.B.
+            einmal geholt für Aufrufe in einer Schleife.
 
     Returns:
         Fertig gerenderte Prompt-Zeichenkette.
     """
-    template_dir = get_template_dir()
-    env = Environment(
-        loader=FileSystemLoader(template_dir),
-        trim_blocks=True,
-        lstrip_blocks=True,
-    )
+    if env is None:
+        env = get_template_env()
 
-    # Sentences_per_section vom Preset wenn vorhanden
-    preset = None
-    sentences_per_section = config.sentences_per_section
-    if preset_name:
-        preset = get_preset_by_name(preset_name)
-        if preset and preset.sentences_per_section > 0:
-            sentences_per_section = preset.sentences_per_section
+    preset, sentences_per_section = _resolve_preset_settings(preset_name, config)
 
     # Preset mit eigenem Transkript-Template (z.B. Musik) nutzt sein Template,
     # andere Presets nutzen das generische Transkript-Template
@@ -400,33 +562,21 @@ def build_prompt_from_transcript(
     else:
         template = env.get_template("somas_prompt_transcript.txt")
 
-    # Perspektive: expliziter Override > Preset-Default > "neutral"
-    effective_perspective = perspective or (preset.perspective if preset else "neutral")
-    perspective_text = get_perspective_text(effective_perspective)
-
-    # Anti-Monotonie wird durch custom_module überschrieben
-    effective_hint = "" if custom_module else anti_monotony_hint
-
-    rendered = template.render(
-        title=title,
-        author=author,
-        url=url,
-        transcript=transcript,
-        is_auto_transcript=is_auto_transcript,
-        # Aliase für Kompatibilität mit Video-Templates
-        video_title=title,
-        channel_name=author,
-        video_url=url or "",
-        depth=config.depth,
-        depth_description=config.depth_description,
-        sentences_per_section=sentences_per_section,
-        language=config.language,
-        time_range=config.time_range,
-        max_chars=preset.max_chars if preset else 0,
-        questions=questions.strip() if questions else "",
-        perspective_text=perspective_text,
-        anti_monotony_hint=effective_hint,
+    context = _shared_render_context(
+        config, preset, sentences_per_section, questions,
+        perspective, anti_monotony_hint, custom_module,
     )
+    context["title"] = title
+    context["author"] = author
+    context["url"] = url
+    context["transcript"] = transcript
+    context["is_auto_transcript"] = is_auto_transcript
+    # Aliase für Kompatibilität mit Video-Templates
+    context["video_title"] = title
+    context["channel_name"] = author
+    context["video_url"] = url or ""
+
+    rendered = template.render(context)
 
     return _apply_custom_overrides(rendered, custom_system_prompt, custom_module)
 
@@ -435,7 +585,9 @@ def build_prompt_with_preset(
     video_info: VideoInfo,
     preset: PromptPreset,
     questions: str = "",
-    time_range: Optional[str] = None
+    time_range: Optional[str] = None,
+    *,
+    env: Optional[Environment] = None,
 ) -> str:
     """Generiert einen SOMAS-Prompt direkt aus einem Preset.
 
@@ -444,16 +596,13 @@ def build_prompt_with_preset(
         preset: Das zu verwendende PromptPreset
         questions: Optionale Anschlussfragen
         time_range: Optionaler Zeitbereich
+        env: Optionale Jinja2-Umgebung (Default: get_template_env())
 
     Returns:
         Fertig gerenderte Prompt-Zeichenkette
     """
-    template_dir = get_template_dir()
-    env = Environment(
-        loader=FileSystemLoader(template_dir),
-        trim_blocks=True,
-        lstrip_blocks=True,
-    )
+    if env is None:
+        env = get_template_env()
 
     template = env.get_template(preset.template_file)
 
@@ -462,7 +611,7 @@ def build_prompt_with_preset(
         channel_name=video_info.channel,
         video_url=video_info.url,
         time_range=time_range,
-        questions=questions.strip() if questions else "",
+        questions=_clean_questions(questions),
     )
 
 
@@ -575,8 +724,11 @@ def clean_synthesis_output(text: str) -> str:
     return "\n".join(lines).strip()
 
 
+@lru_cache(maxsize=64)
 def get_preset_info_for_display(preset: PromptPreset) -> str:
     """Erstellt einen Info-String für die GUI-Anzeige.
+
+    Gecacht: das Ergebnis hängt nur vom (unveränderlichen) Preset ab.
     
     Args:
         preset: Das Preset
@@ -8,7 +8,11 @@ Changelog v0.5.2:
 
 import logging
 import sqlite3
-from dataclasses import dataclass
+import threading
+import weakref
+from collections.abc import Iterable
+from dataclasses import dataclass, fields
+from operator import attrgetter
 from pathlib import Path
 
 logger = logging.getLogger(__name__)
@@ -73,8 +77,9 @@ CREATE INDEX IF NOT EXISTS idx_timestamp ON analyses(timestamp);
 # Schema Version 2: Rating-Redesign (v0.5.2)
 # - channels-Tabelle für Kanal-Bewertungen
 # - model_rating_z in analyses (Z-Skala: -2 bis +2)
-MIGRATION_V2_SQL = """
-CREATE TABLE IF NOT EXISTS channels (
+# Reiner Key-Value-Table mit natürlichem Schlüssel → WITHOUT ROWID
+# (seit Version 5; ein B-Baum statt Rowid-Tabelle + PK-Index)
+CHANNELS_TABLE_SQL = """(
     channel_name    TEXT PRIMARY KEY,
     factual_score   INTEGER DEFAULT 0,
     argument_score  INTEGER DEFAULT 0,
@@ -83,7 +88,10 @@ CREATE TABLE IF NOT EXISTS channels (
     mode_tags       TEXT DEFAULT '',
     notes           TEXT DEFAULT '',
     updated_at      TEXT DEFAULT (datetime('now'))
-);
+) WITHOUT ROWID"""
+
+MIGRATION_V2_SQL = f"""
+CREATE TABLE IF NOT EXISTS channels {CHANNELS_TABLE_SQL};
 """
 
 # Schema Version 3: Modul-Statistik (v0.6.0)
@@ -93,7 +101,96 @@ VALID_MODULES = frozenset({
     "SUBTEXT", "FAKTENCHECK",
 })
 
-CURRENT_SCHEMA_VERSION = 3
+# Schema Version 4: Covering-Indizes für die Ranking-Abfragen (Phase 5)
+# - GROUP BY model_id / channel_name über die Bewertungsspalten direkt aus
+#   dem Index, ohne Zugriff auf die Tabellenzeilen
+MIGRATION_V4_SQL = """
+CREATE INDEX IF NOT EXISTS idx_model_rating
+    ON analyses(model_id, model_rating_z, quality_score);
+CREATE INDEX IF NOT EXISTS idx_channel_rating
+    ON analyses(channel_name, quality_score);
+"""
+
+# Schema Version 5: channels als WITHOUT-ROWID-Tabelle (Umbau bestehender DBs)
+_CHANNELS_COLUMNS = (
+    "channel_name, factual_score, argument_score, bias_direction, "
+    "bias_strength, mode_tags, notes, updated_at"
+)
+MIGRATION_V5_SQL = f"""
+BEGIN;
+CREATE TABLE channels_new {CHANNELS_TABLE_SQL};
+INSERT INTO channels_new ({_CHANNELS_COLUMNS})
+    SELECT {_CHANNELS_COLUMNS} FROM channels WHERE channel_name IS NOT NULL;
+DROP TABLE channels;
+ALTER TABLE channels_new RENAME TO channels;
+COMMIT;
+"""
+
+CURRENT_SCHEMA_VERSION = 5
+
+# Schreib-Statements als Modul-Konstanten: identischer SQL-Text trifft den
+# Prepared-Statement-Cache der (langlebigen) Verbindung
+# Spaltenreihenfolge = Feldreihenfolge von AnalysisRecord, danach die
+# berechneten Limit-Metriken (siehe RatingStore._analysis_params)
+_INSERT_ANALYSIS_SQL = """INSERT INTO analyses (
+    provider_id, model_id, model_name,
+    video_url, video_title, channel_name, video_duration,
+    preset_name, preset_max_chars,
+    result_chars, response_time, tokens_used,
+    price_input, price_output,
+    input_mode, had_transcript, had_time_range, had_questions,
+    limit_ratio, is_over_limit
+) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)"""
+
+# Die UPDATEs schreiben nur, wenn sich ein Wert tatsächlich ändert
+# (IS NOT = NULL-sicherer Vergleich); unveränderte Zeilen erzeugen so
+# keinen WAL-Frame.
+_UPDATE_RATINGS_SQL = """UPDATE analyses SET
+    quality_score = :quality_score,
+    channel_informative = :channel_informative,
+    channel_balanced = :channel_balanced,
+    channel_sourced = :channel_sourced,
+    channel_entertaining = :channel_entertaining
+WHERE id = :id AND (
+    quality_score IS NOT :quality_score
+    OR channel_informative IS NOT :channel_informative
+    OR channel_balanced IS NOT :channel_balanced
+    OR channel_sourced IS NOT :channel_sourced
+    OR channel_entertaining IS NOT :channel_entertaining
+)"""
+
+_UPDATE_MODEL_RATING_Z_SQL = """UPDATE analyses SET model_rating_z = :z
+WHERE id = :id AND model_rating_z IS NOT :z"""
+
+# Echtes UPSERT (SQLite >= 3.24): bestehende Zeile wird in-place
+# aktualisiert statt wie bei INSERT OR REPLACE gelöscht und neu eingefügt
+_UPSERT_CHANNEL_SQL = """INSERT INTO channels (
+    channel_name, factual_score, argument_score,
+    bias_direction, bias_strength, mode_tags, notes,
+    updated_at
+) VALUES (?, ?, ?, ?, ?, ?, ?, datetime('now'))
+ON CONFLICT(channel_name) DO UPDATE SET
+    factual_score = excluded.factual_score,
+    argument_score = excluded.argument_score,
+    bias_direction = excluded.bias_direction,
+    bias_strength = excluded.bias_strength,
+    mode_tags = excluded.mode_tags,
+    notes = excluded.notes,
+    updated_at = datetime('now')"""
+
+# Größe des Prepared-Statement-Caches pro Verbindung (sqlite3-Default: 128)
+_CACHED_STATEMENTS = 256
+
+# Verbindungs-PRAGMAs (gelten pro Verbindung). journal_mode=WAL ist
+# persistent in der DB-Datei und wird nur einmal in _ensure_db gesetzt.
+_SESSION_PRAGMAS = (
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA mmap_size=134217728",
+    "PRAGMA cache_size=-20000",
+    "PRAGMA busy_timeout=5000",
+    "PRAGMA foreign_keys=ON",
+)
 
 
 def extract_module_from_result(
@@ -137,9 +234,12 @@ def extract_module_from_result(
     return None
 
 
-@dataclass
+@dataclass(slots=True)
 class AnalysisRecord:
-    """Datensatz für eine einzelne Analyse."""
+    """Datensatz für eine einzelne Analyse.
+
+    Die Feldreihenfolge entspricht den Spalten in _INSERT_ANALYSIS_SQL.
+    """
 
     # Modell
     provider_id: str
@@ -166,18 +266,54 @@ class AnalysisRecord:
     had_questions: bool = False
 
 
+# Liest alle Felder eines AnalysisRecord als Tupel (in Feldreihenfolge)
+_record_values = attrgetter(*(f.name for f in fields(AnalysisRecord)))
+
+
+def _close_connection(conn: sqlite3.Connection) -> None:
+    """Schließt eine Store-Verbindung (aufgerufen über weakref.finalize).
+
+    Vorher aktualisiert PRAGMA optimize bei Bedarf die Planer-Statistiken
+    (sqlite_stat1), damit die Ranking-Abfragen die Indizes nutzen.
+    """
+    try:
+        conn.execute("PRAGMA optimize")
+    except sqlite3.Error as e:
+        logger.debug(f"PRAGMA optimize fehlgeschlagen: {e}")
+    conn.close()
+
+
 class RatingStore:
-    """Verwaltet die SQLite-Datenbank für Analyse-Bewertungen."""
+    """Verwaltet die SQLite-Datenbank für Analyse-Bewertungen.
+
+    Hält eine langlebige Schreib-Verbindung und eine separate Lese-
+    Verbindung (PRAGMA query_only) für die get_*-Methoden. Beide werden
+    auch aus Worker-Threads (BatchWorker) genutzt; je ein Lock serialisiert
+    die Zugriffe. Dank WAL blockieren sich Lesen und Schreiben nicht.
+    Die Verbindungen werden mit close() geschlossen, spätestens beim
+    Garbage-Collect des Stores oder beim Programmende.
+    """
 
     def __init__(self, db_path: Path = DB_PATH):
         self._db_path = db_path
+        self._conn: sqlite3.Connection | None = None
+        self._finalizer: weakref.finalize | None = None
+        self._lock = threading.Lock()
+        self._ro_conn: sqlite3.Connection | None = None
+        self._ro_finalizer: weakref.finalize | None = None
+        self._ro_lock = threading.Lock()
         self._ensure_db()
 
     def _ensure_db(self) -> None:
         """Erstellt Datenbank und führt Migrationen durch."""
         self._db_path.parent.mkdir(parents=True, exist_ok=True)
-        with self._connect() as conn:
+        with self._lock, self._connect() as conn:
             version = self._get_schema_version(conn)
+            if version < 1:
+                # Nur bei neuer DB wirksam, und nur vor dem Umschalten auf WAL
+                conn.execute("PRAGMA auto_vacuum=INCREMENTAL")
+            # WAL: Leser blockieren den Schreiber nicht, kein Rollback-Journal
+            conn.execute("PRAGMA journal_mode=WAL")
             if version < 1:
                 logger.info("Erstelle initiales DB-Schema (Version 1)")
                 conn.executescript(SCHEMA_V1_SQL)
@@ -187,10 +323,79 @@ class RatingStore:
                 self._migrate_to_v2(conn)
             if version < 3:
                 self._migrate_to_v3(conn)
+            if version < 4:
+                self._migrate_to_v4(conn)
+            if version < 5:
+                self._migrate_to_v5(conn)
 
     def _connect(self) -> sqlite3.Connection:
-        """Erstellt eine DB-Verbindung."""
-        return sqlite3.connect(str(self._db_path))
+        """Gibt die geteilte DB-Verbindung zurück (beim ersten Aufruf erzeugt).
+
+        Aufrufer halten self._lock; ``with conn:`` umschließt wie bisher
+        eine Transaktion (Commit bzw. Rollback), schließt die Verbindung
+        aber nicht.
+        """
+        if self._conn is None:
+            conn = self._open_connection()
+            self._conn = conn
+            self._finalizer = weakref.finalize(self, _close_connection, conn)
+        return self._conn
+
+    def _connect_ro(self) -> sqlite3.Connection:
+        """Gibt die geteilte Lese-Verbindung zurück (Aufrufer hält self._ro_lock).
+
+        query_only statt URI mode=ro: eine mode=ro-Verbindung kann die
+        WAL-Hilfsdateien (-shm/-wal) nicht selbst anlegen.
+        """
+        if self._ro_conn is None:
+            conn = self._open_connection()
+            conn.execute("PRAGMA query_only=ON")
+            self._ro_conn = conn
+            self._ro_finalizer = weakref.finalize(self, conn.close)
+        return self._ro_conn
+
+    def _open_connection(self) -> sqlite3.Connection:
+        """Öffnet und konfiguriert eine neue Verbindung zur Datenbank."""
+        conn = sqlite3.connect(
+            str(self._db_path),
+            check_same_thread=False,
+            cached_statements=_CACHED_STATEMENTS,
+        )
+        conn.row_factory = sqlite3.Row
+        self._configure(conn)
+        return conn
+
+    def close(self) -> None:
+        """Schließt die DB-Verbindungen. Weitere Aufrufe öffnen sie neu."""
+        with self._ro_lock:
+            if self._ro_finalizer is not None:
+                self._ro_finalizer()
+            self._ro_conn = None
+            self._ro_finalizer = None
+        with self._lock:
+            if self._finalizer is not None:
+                self._finalizer()
+            self._conn = None
+            self._finalizer = None
+
+    def maintenance(self) -> None:
+        """Aktualisiert die Planer-Statistiken und gibt freie Seiten frei.
+
+        ANALYZE erhebt die Statistiken vollständig neu; incremental_vacuum
+        wirkt nur bei DBs mit auto_vacuum=INCREMENTAL (ab dieser Version
+        neu angelegte DBs) und ist sonst ein No-Op.
+        """
+        with self._lock:
+            conn = self._connect()
+            conn.execute("ANALYZE")
+            conn.execute("PRAGMA incremental_vacuum")
+            conn.commit()
+
+    @staticmethod
+    def _configure(conn: sqlite3.Connection) -> None:
+        """Setzt die Verbindungs-PRAGMAs (Sync-Level, Cache, Busy-Timeout)."""
+        for pragma in _SESSION_PRAGMAS:
+            conn.execute(pragma)
 
     def _get_schema_version(self, conn: sqlite3.Connection) -> int:
         """Liest die aktuelle Schema-Version. 0 wenn noch keine Versionierung."""
@@ -266,44 +471,80 @@ class RatingStore:
             logger.exception(f"Migration auf Version 3 fehlgeschlagen: {e}")
             raise
 
+    def _migrate_to_v4(self, conn: sqlite3.Connection) -> None:
+        """Migration zu Version 4: Covering-Indizes für Rankings."""
+        logger.info("Migriere DB-Schema auf Version 4")
+        try:
+            conn.executescript(MIGRATION_V4_SQL)
+            # Planer-Statistiken für die neuen Indizes erheben
+            conn.execute("ANALYZE")
+            self._set_schema_version(conn, 4)
+            logger.info("DB-Schema auf Version 4 migriert")
+        except Exception as e:
+            logger.exception(f"Migration auf Version 4 fehlgeschlagen: {e}")
+            raise
+
+    def _migrate_to_v5(self, conn: sqlite3.Connection) -> None:
+        """Migration zu Version 5: channels als WITHOUT-ROWID-Tabelle."""
+        logger.info("Migriere DB-Schema auf Version 5")
+        try:
+            row = conn.execute(
+                "SELECT sql FROM sqlite_master "
+                "WHERE type='table' AND name='channels'"
+            ).fetchone()
+            # Über Version 2 neu angelegte DBs haben das Layout bereits
+            if row is not None and "WITHOUT ROWID" not in row[0].upper():
+                conn.executescript(MIGRATION_V5_SQL)
+            self._set_schema_version(conn, 5)
+            logger.info("DB-Schema auf Version 5 migriert")
+        except Exception as e:
+            logger.exception(f"Migration auf Version 5 fehlgeschlagen: {e}")
+            raise
+
     # --- Analyse-CRUD ---
 
-    def save_analysis(self, record: AnalysisRecord) -> int:
-        """Speichert eine Analyse und gibt die ID zurück."""
+    @staticmethod
+    def _analysis_params(record: AnalysisRecord) -> tuple:
+        """Baut die INSERT-Parameter inkl. berechneter Limit-Metriken."""
         limit_ratio = None
         is_over_limit = False
         if record.preset_max_chars > 0:
             limit_ratio = record.result_chars / record.preset_max_chars
             is_over_limit = record.result_chars > record.preset_max_chars
+        return _record_values(record) + (limit_ratio, is_over_limit)
 
-        with self._connect() as conn:
-            cursor = conn.execute(
-                """INSERT INTO analyses (
-                    provider_id, model_id, model_name,
-                    video_url, video_title, channel_name, video_duration,
-                    preset_name, preset_max_chars,
-                    result_chars, response_time, tokens_used,
-                    price_input, price_output,
-                    limit_ratio, is_over_limit,
-                    input_mode, had_transcript, had_time_range, had_questions
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)""",
-                (
-                    record.provider_id, record.model_id, record.model_name,
-                    record.video_url, record.video_title, record.channel_name,
-                    record.video_duration,
-                    record.preset_name, record.preset_max_chars,
-                    record.result_chars, record.response_time, record.tokens_used,
-                    record.price_input, record.price_output,
-                    limit_ratio, is_over_limit,
-                    record.input_mode, record.had_transcript,
-                    record.had_time_range, record.had_questions,
-                ),
-            )
+    def save_analysis(self, record: AnalysisRecord) -> int:
+        """Speichert eine Analyse und gibt die ID zurück."""
+        params = self._analysis_params(record)
+        with self._lock, self._connect() as conn:
+            cursor = conn.execute(_INSERT_ANALYSIS_SQL, params)
             row_id = cursor.lastrowid
             if row_id is None:
                 raise RuntimeError("INSERT hat keine lastrowid zurückgegeben")
             return row_id
 
+    def save_analyses(self, records: Iterable[AnalysisRecord]) -> list[int]:
+        """Speichert mehrere Analysen in einer einzigen Transaktion.
+
+        Für Massenimporte/Backfills: ein Commit (ein fsync) für alle Zeilen
+        statt einem pro Analyse. Schlägt ein INSERT fehl, wird nichts
+        gespeichert.
+
+        Args:
+            records: Die zu speichernden Analysen.
+
+        Returns:
+            IDs der neuen Zeilen in Eingabereihenfolge.
+        """
+        params = [self._analysis_params(r) for r in records]
+        if not params:
+            return []
+        row_ids = []
+        with self._lock, self._connect() as conn:
+            for p in params:
+                row_ids.append(conn.execute(_INSERT_ANALYSIS_SQL, p).lastrowid)
+        return row_ids
+
     def update_model_rating_z(self, analysis_id: int, z_score: int) -> None:
         """Setzt die Modell-Bewertung auf der Z-Skala (-2 bis +2).
 
@@ -313,10 +554,9 @@ class RatingStore:
         """
         if not -2 <= z_score <= 2:
             raise ValueError(f"Z-Score muss -2 bis +2 sein, war: {z_score}")
-        with self._connect() as conn:
+        with self._lock, self._connect() as conn:
             conn.execute(
-                "UPDATE analyses SET model_rating_z = ? WHERE id = ?",
-                (z_score, analysis_id),
+                _UPDATE_MODEL_RATING_Z_SQL, {"z": z_score, "id": analysis_id}
             )
 
     def update_chosen_module(self, analysis_id: int, module_name: str) -> None:
@@ -331,7 +571,7 @@ class RatingStore:
                 f"Unbekanntes Modul '{module_name}' für Analyse {analysis_id}"
             )
             return
-        with self._connect() as conn:
+        with self._lock, self._connect() as conn:
             conn.execute(
                 "UPDATE analyses SET chosen_module = ? WHERE id = ?",
                 (module_name, analysis_id),
@@ -348,8 +588,8 @@ class RatingStore:
         """
         if limit <= 0:
             return []
-        with self._connect() as conn:
-            rows = conn.execute(
+        with self._ro_lock:
+            rows = self._connect_ro().execute(
                 "SELECT chosen_module FROM analyses "
                 "ORDER BY id DESC LIMIT ?",
                 (limit,),
@@ -375,22 +615,23 @@ class RatingStore:
             quality_score: 0 = nicht bewertet, 1-5 = Sterne
             channel_*: 0 = nicht bewertet, 1 = gut, -1 = schlecht
         """
-        with self._connect() as conn:
-            db_quality = quality_score if quality_score > 0 else None
-            db_informative = channel_informative if channel_informative != 0 else None
-            db_balanced = channel_balanced if channel_balanced != 0 else None
-            db_sourced = channel_sourced if channel_sourced != 0 else None
-            db_entertaining = channel_entertaining if channel_entertaining != 0 else None
+        # Ein einziges UPDATE für alle fünf Spalten (0 = nicht bewertet → NULL)
+        db_quality = quality_score if quality_score > 0 else None
+        db_informative = channel_informative if channel_informative != 0 else None
+        db_balanced = channel_balanced if channel_balanced != 0 else None
+        db_sourced = channel_sourced if channel_sourced != 0 else None
+        db_entertaining = channel_entertaining if channel_entertaining != 0 else None
+        with self._lock, self._connect() as conn:
             conn.execute(
-                """UPDATE analyses SET
-                    quality_score = ?,
-                    channel_informative = ?,
-                    channel_balanced = ?,
-                    channel_sourced = ?,
-                    channel_entertaining = ?
-                WHERE id = ?""",
-                (db_quality, db_informative, db_balanced,
-                 db_sourced, db_entertaining, analysis_id),
+                _UPDATE_RATINGS_SQL,
+                {
+                    "quality_score": db_quality,
+                    "channel_informative": db_informative,
+                    "channel_balanced": db_balanced,
+                    "channel_sourced": db_sourced,
+                    "channel_entertaining": db_entertaining,
+                    "id": analysis_id,
+                },
             )
 
     # --- Kanal-CRUD ---
@@ -416,13 +657,9 @@ class RatingStore:
             mode_tags: Komma-getrennte Tags (z.B. "Bildung,Interview").
             notes: Freitext-Notizen.
         """
-        with self._connect() as conn:
+        with self._lock, self._connect() as conn:
             conn.execute(
-                """INSERT OR REPLACE INTO channels (
-                    channel_name, factual_score, argument_score,
-                    bias_direction, bias_strength, mode_tags, notes,
-                    updated_at
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, datetime('now'))""",
+                _UPSERT_CHANNEL_SQL,
                 (
                     channel_name, factual_score, argument_score,
                     bias_direction, bias_strength, mode_tags, notes,
@@ -435,9 +672,8 @@ class RatingStore:
         Returns:
             Dict mit allen Kanal-Feldern oder None wenn nicht bewertet.
         """
-        with self._connect() as conn:
-            conn.row_factory = sqlite3.Row
-            row = conn.execute(
+        with self._ro_lock:
+            row = self._connect_ro().execute(
                 "SELECT * FROM channels WHERE channel_name = ?",
                 (channel_name,),
             ).fetchone()
@@ -445,18 +681,19 @@ class RatingStore:
                 return None
             return dict(row)
 
-    def get_all_channels(self) -> list[dict]:
+    def get_all_channels(self) -> list[sqlite3.Row]:
         """Gibt alle bewerteten Kanäle zurück.
 
+        Die Zeilen werden ohne Dict-Kopie geliefert; Zugriff per
+        Spaltenname (``row["channel_name"]``) oder Index.
+
         Returns:
-            Liste von Dicts mit allen Kanal-Feldern.
+            Liste von sqlite3.Row mit allen Kanal-Feldern.
         """
-        with self._connect() as conn:
-            conn.row_factory = sqlite3.Row
-            rows = conn.execute(
+        with self._ro_lock:
+            return self._connect_ro().execute(
                 "SELECT * FROM channels ORDER BY channel_name"
             ).fetchall()
-            return [dict(row) for row in rows]
 
     # --- CSV Export/Import ---
 
@@ -484,21 +721,17 @@ class RatingStore:
         ]
 
         with open(path, "w", newline="", encoding="utf-8-sig") as f:
-            writer = csv.DictWriter(
-                f, fieldnames=fieldnames, delimiter=";",
-                extrasaction="ignore",
-            )
-            writer.writeheader()
-            for ch in channels:
-                writer.writerow(ch)
+            writer = csv.writer(f, delimiter=";")
+            writer.writerow(fieldnames)
+            writer.writerows([ch[name] for name in fieldnames] for ch in channels)
 
         return len(channels)
 
     def import_channels_csv(self, path: Path) -> tuple[int, int]:
         """Importiert Kanal-Bewertungen aus CSV.
 
-        Verwendet INSERT OR REPLACE (UPSERT) — bestehende Kanäle
-        werden aktualisiert.
+        Verwendet UPSERT (INSERT … ON CONFLICT DO UPDATE) — bestehende
+        Kanäle werden aktualisiert.
 
         Args:
             path: Pfad zur CSV-Datei.
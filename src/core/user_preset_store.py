@@ -4,12 +4,13 @@ Speichert User-Presets in user_presets.json. Jedes Preset enthält einen
 angepassten system_prompt und optional ein fixiertes Modul.
 """
 
-import json
 import logging
 from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
 
+import orjson
+
 logger = logging.getLogger(__name__)
 
 USER_PRESETS_PATH = Path(__file__).parent.parent / "config" / "user_presets.json"
@@ -55,7 +56,7 @@ class UserPresetStore:
             self._save_raw({"version": "1.0", "presets": []})
             return
         try:
-            data = json.loads(self._path.read_text(encoding="utf-8"))
+            data = orjson.loads(self._path.read_bytes())
             self._presets = []
             for p in data.get("presets", []):
                 # Ungültige Module beim Laden auf None normalisieren
@@ -63,7 +64,7 @@ class UserPresetStore:
                 if module is not None and module not in VALID_MODULES:
                     p["fixed_module"] = None
                 self._presets.append(UserPreset(**p))
-        except (json.JSONDecodeError, OSError, TypeError, ValueError) as e:
+        except (orjson.JSONDecodeError, OSError, TypeError, ValueError) as e:
             logger.warning("user_presets.json konnte nicht geladen werden: %s", e)
             self._presets = []
 
@@ -71,10 +72,7 @@ class UserPresetStore:
         """Schreibt Roh-Dict als JSON (atomar via Temp-Datei + Replace)."""
         self._path.parent.mkdir(parents=True, exist_ok=True)
         tmp_path = self._path.with_suffix(".json.tmp")
-        tmp_path.write_text(
-            json.dumps(data, ensure_ascii=False, indent=2),
-            encoding="utf-8",
-        )
+        tmp_path.write_bytes(orjson.dumps(data, option=orjson.OPT_INDENT_2))
         tmp_path.replace(self._path)
 
     def _save(self) -> None:
@@ -2,6 +2,11 @@
 
 import logging
 import re
+import sqlite3
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
 from typing import Optional
 
 import yt_dlp
@@ -9,10 +14,17 @@ from youtube_transcript_api import YouTubeTranscriptApi
 from youtube_transcript_api import TranscriptsDisabled, NoTranscriptFound
 
 from src.config.defaults import VideoInfo
+from src.core.rating_store import DB_DIR
 
 
 logger = logging.getLogger(__name__)
 
+# Watch-, Kurz-, Shorts- und Embed-URLs in einem einzigen Suchlauf
+_VIDEO_ID_RE = re.compile(
+    r'(?:youtube\.com/watch\?v=|youtu\.be/|youtube\.com/shorts/|youtube\.com/embed/)'
+    r'([a-zA-Z0-9_-]{11})'
+)
+
 
 def extract_video_id(url: str) -> Optional[str]:
     """Extrahiert die Video-ID aus einer YouTube-URL.
@@ -23,16 +35,163 @@ def extract_video_id(url: str) -> Optional[str]:
     Returns:
         Video-ID oder None bei ungültiger URL
     """
-    patterns = [
-        r'(?:youtube\.com/watch\?v=|youtu\.be/|youtube\.com/shorts/)([a-zA-Z0-9_-]{11})',
-        r'youtube\.com/embed/([a-zA-Z0-9_-]{11})',
-    ]
+    match = _VIDEO_ID_RE.search(url)
+    return match.group(1) if match else None
+
+
+# Persistenter Cache für Metadaten und Transkripte (neben ratings.db).
+# Beides ist pro Video praktisch unveränderlich; nach der TTL wird neu geholt.
+VIDEO_CACHE_PATH = DB_DIR / "video_cache.db"
+_VIDEO_CACHE_TTL_SECONDS = 7 * 24 * 3600
+
+# Format-Version (PRAGMA user_version); bei Änderung wird der Cache verworfen
+_VIDEO_CACHE_VERSION = 2
+
+_VIDEO_CACHE_SCHEMA_SQL = """
+CREATE TABLE IF NOT EXISTS video_meta (
+    video_id    TEXT PRIMARY KEY,
+    title       TEXT NOT NULL,
+    channel     TEXT NOT NULL,
+    duration    INTEGER,
+    fetched_at  REAL NOT NULL
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS transcripts (
+    video_id        TEXT NOT NULL,
+    language        TEXT NOT NULL,  -- angefragte Sprache (Cache-Key)
+    source_language TEXT NOT NULL,  -- tatsächliche Sprache des Transkripts
+    transcript      TEXT NOT NULL,
+    fetched_at      REAL NOT NULL,
+    PRIMARY KEY (video_id, language)
+) WITHOUT ROWID;
+"""
+
+# Ein Fallback-Transkript (source_language != language) überschreibt nie
+# ein noch gültiges Transkript in der angefragten Sprache
+_UPSERT_TRANSCRIPT_SQL = f"""INSERT INTO transcripts
+    (video_id, language, source_language, transcript, fetched_at)
+VALUES (?, ?, ?, ?, ?)
+ON CONFLICT(video_id, language) DO UPDATE SET
+    source_language = excluded.source_language,
+    transcript = excluded.transcript,
+    fetched_at = excluded.fetched_at
+WHERE excluded.source_language = excluded.language
+    OR transcripts.source_language != transcripts.language
+    OR transcripts.fetched_at < excluded.fetched_at - {_VIDEO_CACHE_TTL_SECONDS}"""
+
+
+class _VideoCache:
+    """SQLite-Cache für yt-dlp-Metadaten und Transkripte, Key: video_id.
+
+    Cache-Fehler sind nie kritisch: sie werden geloggt und wie ein
+    Cache-Miss behandelt. Nicht verfügbare Transkripte werden nicht
+    gecacht (automatische Untertitel erscheinen oft erst später).
+    """
 
-    for pattern in patterns:
-        match = re.search(pattern, url)
-        if match:
-            return match.group(1)
-    return None
+    def __init__(self, path: Path) -> None:
+        self._path = path
+        self._conn: sqlite3.Connection | None = None
+        self._lock = threading.Lock()
+
+    def _connect(self) -> sqlite3.Connection:
+        """Öffnet die Verbindung beim ersten Zugriff (Aufrufer hält den Lock)."""
+        if self._conn is None:
+            self._path.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(str(self._path), check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            if conn.execute("PRAGMA user_version").fetchone()[0] < _VIDEO_CACHE_VERSION:
+                # Älteres Format: Transkripte ohne source_language verwerfen
+                conn.execute("DROP TABLE IF EXISTS transcripts")
+                conn.execute(f"PRAGMA user_version={_VIDEO_CACHE_VERSION}")
+            conn.executescript(_VIDEO_CACHE_SCHEMA_SQL)
+            self._conn = conn
+        return self._conn
+
+    def _fetch(self, sql: str, params: tuple) -> tuple | None:
+        """Liest eine nicht abgelaufene Zeile oder None."""
+        min_fetched_at = time.time() - _VIDEO_CACHE_TTL_SECONDS
+        try:
+            with self._lock:
+                return self._connect().execute(
+                    sql, params + (min_fetched_at,)
+                ).fetchone()
+        except sqlite3.Error as e:
+            logger.debug(f"Video-Cache nicht lesbar: {e}")
+            return None
+
+    def _store(self, sql: str, params: tuple) -> None:
+        """Schreibt eine Zeile (ersetzt abgelaufene Einträge)."""
+        try:
+            with self._lock, self._connect() as conn:
+                conn.execute(sql, params + (time.time(),))
+        except sqlite3.Error as e:
+            logger.debug(f"Video-Cache nicht beschreibbar: {e}")
+
+    def get_meta(self, video_id: str) -> tuple[str, str, int | None] | None:
+        """Gibt (Titel, Kanal, Dauer) zurück oder None bei Cache-Miss."""
+        return self._fetch(
+            "SELECT title, channel, duration FROM video_meta "
+            "WHERE video_id = ? AND fetched_at >= ?",
+            (video_id,),
+        )
+
+    def put_meta(
+        self, video_id: str, title: str, channel: str, duration: int | None
+    ) -> None:
+        """Speichert die Metadaten eines Videos."""
+        self._store(
+            "INSERT OR REPLACE INTO video_meta "
+            "(video_id, title, channel, duration, fetched_at) "
+            "VALUES (?, ?, ?, ?, ?)",
+            (video_id, title, channel, duration),
+        )
+
+    def get_transcript(self, video_id: str, language: str) -> str | None:
+        """Gibt das gecachte Transkript zurück oder None bei Cache-Miss."""
+        row = self._fetch(
+            "SELECT transcript FROM transcripts "
+            "WHERE video_id = ? AND language = ? AND fetched_at >= ?",
+            (video_id, language),
+        )
+        return row[0] if row else None
+
+    def put_transcript(
+        self,
+        video_id: str,
+        language: str,
+        transcript: str,
+        source_language: str | None = None,
+    ) -> None:
+        """Speichert ein Transkript für die angefragte Sprache.
+
+        Ist es ein Fallback (source_language weicht ab), wird es zusätzlich
+        unter seiner tatsächlichen Sprache abgelegt.
+
+        Args:
+            video_id: YouTube-Video-ID.
+            language: Angefragte Sprache (Cache-Key).
+            transcript: Transkript-Text.
+            source_language: Tatsächliche Sprache (Standard: language).
+        """
+        source_language = source_language or language
+        self._store(
+            _UPSERT_TRANSCRIPT_SQL,
+            (video_id, language, source_language, transcript),
+        )
+        if source_language != language:
+            self._store(
+                _UPSERT_TRANSCRIPT_SQL,
+                (video_id, source_language, source_language, transcript),
+            )
+
+
+_video_cache = _VideoCache(VIDEO_CACHE_PATH)
+
+# Transkript-Abruf läuft parallel zur yt-dlp-Extraktion (Threads entstehen lazy).
+# Wird bewusst nie heruntergefahren: lebt so lange wie der Prozess.
+_transcript_executor = ThreadPoolExecutor(
+    max_workers=2, thread_name_prefix="somas_transcript"
+)
 
 
 def build_thumbnail_urls(video_id: str) -> dict:
@@ -72,27 +231,46 @@ def get_video_info(url: str) -> VideoInfo:
     if not video_id:
         raise ValueError(f"Ungültige YouTube-URL: {url}")
 
+    # Nur Titel, Kanal und Dauer werden gebraucht: kein Player-JS
+    # (Signatur-Entschlüsselung der Formate) und keine Format-Auswahl
     ydl_opts = {
         'quiet': True,
         'no_warnings': True,
-        'extract_flat': False,
+        'skip_download': True,
+        'extractor_args': {'youtube': {'player_skip': ['js']}},
     }
 
-    try:
-        with yt_dlp.YoutubeDL(ydl_opts) as ydl:
-            info = ydl.extract_info(url, download=False)
+    # Transkript abrufen (optional, Fehler nicht kritisch) – parallel zu
+    # den Metadaten, beide Requests sind unabhängig voneinander
+    transcript_future = _transcript_executor.submit(get_transcript, url)
 
-        # Transkript abrufen (optional, Fehler nicht kritisch)
-        transcript = get_transcript(url) or ""
+    try:
+        cached = _video_cache.get_meta(video_id)
+        if cached is not None:
+            title, channel, duration = cached
+        else:
+            with yt_dlp.YoutubeDL(ydl_opts) as ydl:
+                info = ydl.extract_info(url, download=False, process=False)
+            title = info.get('title', 'Unbekannter Titel')
+            channel = info.get('uploader', 'Unbekannter Kanal')
+            duration = info.get('duration', 0)
+            # Unvollständige Antworten (Platzhalter) nicht für die TTL festschreiben
+            if info.get('title') and info.get('uploader'):
+                _video_cache.put_meta(video_id, title, channel, duration)
+
+        transcript = transcript_future.result() or ""
 
         return VideoInfo(
-            title=info.get('title', 'Unbekannter Titel'),
-            channel=info.get('uploader', 'Unbekannter Kanal'),
-            duration=info.get('duration', 0),
+            title=title,
+            channel=channel,
+            duration=duration,
             url=url,
             transcript=transcript,
         )
     except Exception as e:
+        # Noch wartender Transkript-Abruf wird nicht mehr gebraucht
+        # (ein bereits laufender endet von selbst)
+        transcript_future.cancel()
         logger.error(f"Fehler beim Abruf der Metadaten: {e}")
         raise ValueError(f"Konnte Video-Informationen nicht abrufen: {e}")
 
@@ -112,6 +290,10 @@ def get_transcript(url: str, language: str = "de") -> Optional[str]:
         logger.warning(f"Konnte Video-ID nicht extrahieren: {url}")
         return None
 
+    cached = _video_cache.get_transcript(video_id, language)
+    if cached is not None:
+        return cached
+
     try:
         api = YouTubeTranscriptApi()
         transcript_list = api.list(video_id)
@@ -128,8 +310,11 @@ def get_transcript(url: str, language: str = "de") -> Optional[str]:
 
         # Transkript-Einträge zu Text zusammenfügen
         entries = transcript.fetch()
-        text_parts = [snippet.text for snippet in entries]
-        return ' '.join(text_parts)
+        text = ' '.join(snippet.text for snippet in entries)
+        _video_cache.put_transcript(
+            video_id, language, text, source_language=transcript.language_code
+        )
+        return text
 
     except TranscriptsDisabled:
         logger.warning(f"Transkripte sind für dieses Video deaktiviert: {video_id}")
@@ -2,13 +2,15 @@
 
 import logging
 import re
+from dataclasses import replace
+
 from PyQt6.QtWidgets import (
     QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
     QLabel, QLineEdit, QPushButton, QTextEdit, QMessageBox,
     QFrame, QApplication, QComboBox, QCheckBox, QTabWidget,
     QScrollArea, QMenu, QInputDialog,
 )
-from PyQt6.QtCore import Qt, pyqtSlot, QEvent, QPoint
+from PyQt6.QtCore import Qt, pyqtSlot, QEvent, QPoint, QTimer
 from PyQt6.QtGui import QFont
 
 from src.config.defaults import VideoInfo, SomasConfig, TimeRange
@@ -16,7 +18,7 @@ from src.core.youtube_client import get_video_info
 from src.core.prompt_builder import (
     build_prompt, build_prompt_from_transcript,
     load_presets, get_preset_by_name, get_preset_by_id, PromptPreset,
-    get_anti_monotony_hint,
+    get_anti_monotony_hint, warm_template_cache,
 )
 from src.core.linkedin_formatter import format_for_linkedin
 from src.core.export import export_to_markdown, get_suggested_filename, save_markdown
@@ -37,12 +39,15 @@ from src.core.comparison_worker import ComparisonWorker
 from src.config.api_config import (
     load_providers, get_api_key, has_api_key,
     get_last_provider, get_last_model, save_last_selection,
-    load_preferences,
+    load_preferences, flush_preferences,
 )
 
 
 logger = logging.getLogger(__name__)
 
+# Verzögerung, nach der eine geänderte Modellauswahl auf die Platte geht
+PREFS_FLUSH_DELAY_MS = 1500
+
 # Kürzungs-Prompt für Ergebnis-Nachbearbeitung (Teil 3: Zeichenlimit-Reihe)
 REWORK_PROMPT_TEMPLATE = """Kürze die folgende SOMAS-Analyse auf EXAKT unter {max_chars} Zeichen.
 
@@ -155,10 +160,12 @@ class MainWindow(QMainWindow):
         # Debug-Logger (Preference-gesteuert)
         prefs = load_preferences()
         self._debug_logger = DebugLogger(enabled=prefs.get("debug_logging", False))
+        self._setup_prefs_flush_timer()
 
         # Lade Presets mit Fehlerbehandlung
         try:
             self.presets = load_presets()
+            warm_template_cache(self.presets)
         except Exception as e:
             logger.error(f"Fehler beim Laden der Presets: {e}")
             self.presets = {}
@@ -175,6 +182,28 @@ class MainWindow(QMainWindow):
         self._restore_api_selection()  # Letzte Provider/Modell-Auswahl wiederherstellen
         self._check_batch_recovery()  # Unvollständige Batch-Sessions prüfen
 
+    def _setup_prefs_flush_timer(self) -> None:
+        """Legt den Timer an, der gepufferte Preferences verzögert schreibt.
+
+        Schnelles Durchklicken der Modelle erzeugt so nur einen
+        Schreibvorgang, und eine Auswahl überlebt auch einen Absturz.
+        """
+        self._prefs_flush_timer = QTimer(self)
+        self._prefs_flush_timer.setSingleShot(True)
+        self._prefs_flush_timer.setInterval(PREFS_FLUSH_DELAY_MS)
+        self._prefs_flush_timer.timeout.connect(flush_preferences)
+
+    def _remember_selection(self, provider_id: str, model_id: str) -> None:
+        """Merkt die Provider/Modell-Auswahl vor und startet den Flush-Timer neu."""
+        save_last_selection(provider_id, model_id)
+        self._prefs_flush_timer.start()
+
+    def closeEvent(self, event):
+        """Schreibt ausstehende Preferences beim Schließen des Fensters."""
+        self._prefs_flush_timer.stop()
+        flush_preferences()
+        super().closeEvent(event)
+
     def _check_batch_recovery(self):
         """Prüft beim Start auf unvollständige Batch-Sessions und bietet Wiederherstellung an."""
         from src.core.batch_persistence import find_recoverable_sessions, load_session, delete_batch_session
@@ -1226,7 +1255,6 @@ class MainWindow(QMainWindow):
             self.btn_copy_prompt.setText("Copied!")
             self.btn_copy_prompt.setEnabled(False)
             # Nach 1 Sekunde zurücksetzen
-            from PyQt6.QtCore import QTimer
             QTimer.singleShot(1000, lambda: self._reset_copy_button(original_text))
 
     def _reset_copy_button(self, text: str):
@@ -1482,15 +1510,18 @@ class MainWindow(QMainWindow):
             models_data = client.get_available_models()
             if models_data:
                 self._openrouter_raw_models = models_data
-                provider = self._api_providers[provider_id]
-                provider.models = [
-                    ProviderModel(
-                        id=m["id"],
-                        name=m["name"],
-                        description=m.get("description", ""),
-                    )
-                    for m in models_data
-                ]
+                provider = replace(
+                    self._api_providers[provider_id],
+                    models=tuple(
+                        ProviderModel(
+                            id=m["id"],
+                            name=m["name"],
+                            description=m.get("description", ""),
+                        )
+                        for m in models_data
+                    ),
+                )
+                self._api_providers[provider_id] = provider
                 logger.info(
                     f"Dynamische Modell-Liste für {provider_id}: "
                     f"{len(provider.models)} Modelle"
@@ -1615,7 +1646,7 @@ class MainWindow(QMainWindow):
         """Handler für FilterableModelSelector-Auswahl."""
         provider_id = self.provider_combo.currentData()
         if provider_id and model_id:
-            save_last_selection(provider_id, model_id)
+            self._remember_selection(provider_id, model_id)
 
     @pyqtSlot(int)
     def _on_model_changed(self, _index: int) -> None:
@@ -1624,7 +1655,7 @@ class MainWindow(QMainWindow):
         provider_id = self.provider_combo.currentData()
         model_id = self.model_combo.currentData()
         if provider_id and model_id:
-            save_last_selection(provider_id, model_id)
+            self._remember_selection(provider_id, model_id)
 
     def _check_web_search_compatibility(self) -> None:
         """Prüft ob das aktuelle Preset Web-Search braucht und der Provider es bietet."""
@@ -2376,7 +2407,6 @@ class MainWindow(QMainWindow):
 
     def _show_button_feedback(self, button: QPushButton, message: str):
         """Zeigt kurzes Feedback auf einem Button."""
-        from PyQt6.QtCore import QTimer
         original_text = button.text()
         button.setText(message)
         button.setEnabled(False)
@@ -9,6 +9,7 @@ das Provider→Modell-Mapping aus dem Hauptfenster zur Wiederverwendung.
 """
 
 import logging
+from dataclasses import replace
 
 from PyQt6.QtCore import pyqtSignal, pyqtSlot
 from PyQt6.QtWidgets import QComboBox, QHBoxLayout, QLabel, QWidget
@@ -170,12 +171,15 @@ class ProviderModelPicker(QWidget):
             models_data = client.get_available_models()
             if models_data:
                 self._openrouter_raw = models_data
-                self._providers[provider_id].models = [
-                    ProviderModel(
-                        id=m["id"], name=m["name"], description=m.get("description", "")
-                    )
-                    for m in models_data
-                ]
+                self._providers[provider_id] = replace(
+                    self._providers[provider_id],
+                    models=tuple(
+                        ProviderModel(
+                            id=m["id"], name=m["name"], description=m.get("description", "")
+                        )
+                        for m in models_data
+                    ),
+                )
         except Exception as e:  # noqa: BLE001 — Netzwerkfehler nicht fatal
             logger.warning(f"OpenRouter-Modelle nicht geladen: {e}")
 
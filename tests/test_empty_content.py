@@ -12,6 +12,8 @@ import sys
 from pathlib import Path
 from unittest.mock import patch, MagicMock
 
+import orjson
+
 # Projekt-Root auf den Importpfad legen (Lauf ohne Installation/pytest)
 sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
 
@@ -24,10 +26,12 @@ class FakeResp:
     status_code = 200
     def __init__(self, payload): self._p = payload
     def json(self): return self._p
+    @property
+    def content(self): return orjson.dumps(self._p)
 
 
 def _run_requests_client(cls, module_path, payload):
-    with patch(f"{module_path}.requests.post", return_value=FakeResp(payload)):
+    with patch(f"{module_path}.requests.Session.post", return_value=FakeResp(payload)):
         return cls("dummy-key").send_prompt("prompt", "some/model")
 
 
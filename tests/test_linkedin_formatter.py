@@ -0,0 +1,107 @@
+"""Regressionstest: LinkedIn-Formatter (Inline-Markdown, SOMAS-Header, Quellen).
+
+Hintergrund: Die Inline-Umwandlung (**bold**, *italic*, _italic_, `code`)
+läuft in einem einzigen Regex-Durchlauf, Bullets per String-Operation.
+Code-Spans werden dabei nicht mehr kursiv verfälscht (`my_var_name`),
+Unterstriche in fettem Text bleiben erhalten.
+
+Lauf (ohne pytest):  python tests/test_linkedin_formatter.py
+"""
+import sys
+from pathlib import Path
+
+# Projekt-Root auf den Importpfad legen (Lauf ohne Installation/pytest)
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from src.core.linkedin_formatter import (
+    format_for_linkedin,
+    to_bold,
+    to_italic,
+)
+
+
+def test_unicode_tables():
+    # Nicht abgebildete Zeichen (Umlaute, Satzzeichen, Nicht-BMP) bleiben erhalten
+    assert to_bold("Ab9 äß!😀") == "𝗔𝗯𝟵 äß!😀"
+    assert to_italic("Ab9 äß!😀") == "𝘈𝘣9 äß!😀"
+    assert to_bold("") == ""
+    print("  Unicode-Tabellen: OK")
+
+
+def test_inline_markdown():
+    text, sources = format_for_linkedin(
+        "FRAMING\n"
+        "Das ist **fett**, *kursiv* und _auch_ mit `code`.\n"
+        "- Punkt\n"
+        "  - Unterpunkt\n"
+        "Nutze `my_var_name` und **a_b_c**"
+    )
+    lines = text.split("\n")
+    assert lines[0] == f"Das ist {to_bold('fett')}, {to_italic('kursiv')} und {to_italic('auch')} mit code."
+    assert lines[1] == "• Punkt"
+    assert lines[2] == "  • Unterpunkt"
+    assert lines[3] == f"Nutze my_var_name und {to_bold('a_b_c')}"
+    assert sources == ""
+    print("  Inline-Markdown: OK")
+
+
+def test_somas_headers_and_intro():
+    text, _ = format_for_linkedin(
+        "Hier ist die Analyse:\n### FRAMING\nErster Absatz\nKERNTHESE: These\n"
+        "## Anderer Header\nKRITIK\nKritik-Text"
+    )
+    assert text == "Erster Absatz\nThese\n\nKritik-Text", text
+    print("  SOMAS-Header/Einleitung: OK")
+
+
+def test_sources():
+    text, sources = format_for_linkedin(
+        "FRAMING\nSiehe [Times](https://timesofisrael.com/a) und "
+        "https://www.cnn.com/x, dazu cnn [2] nochmal https://cnn.com/y ende",
+        "Titel", "Kanal",
+    )
+    assert text.startswith(f"{to_bold('Titel')}\nKanal, YT\n\n"), text
+    assert "Siehe Times [1] und [2], dazu [2] nochmal [3] ende" in text, text
+    assert text.endswith("Quellen: 1: timesofisrael | 2,3: cnn"), text
+    assert sources == (
+        "Quellenangaben im Detail:\n"
+        "[1] Times - https://timesofisrael.com/a\n"
+        "[2] cnn - https://www.cnn.com/x\n"
+        "[3] cnn - https://cnn.com/y"
+    ), sources
+    print("  Quellenblock: OK")
+
+
+def test_unclosed_links():
+    # Unvollständige Links bleiben Text; viele "[" ohne Abschluss dürfen
+    # nicht zu Backtracking führen (possessive Quantoren)
+    raw = "[[[offen [a](b ohne Ende " + "[" * 5000
+    text, sources = format_for_linkedin("FRAMING\n" + raw)
+    assert text == raw.strip(), text[:80]
+    assert sources == ""
+    print("  Unvollständige Links: OK")
+
+
+def test_api_citations():
+    text, sources = format_for_linkedin(
+        "FRAMING\nText [1] und spiegel [1].",
+        citations=["https://www.spiegel.de/a"],
+    )
+    assert text == "Text [1] und [1].\n\nQuellen: 1: spiegel", text
+    assert sources == "Quellenangaben im Detail:\n[1] spiegel - https://www.spiegel.de/a"
+    print("  API-Citations: OK")
+
+
+def main():
+    print("Tests LinkedIn-Formatter:")
+    test_unicode_tables()
+    test_inline_markdown()
+    test_somas_headers_and_intro()
+    test_sources()
+    test_unclosed_links()
+    test_api_citations()
+    print("ALLE TESTS OK")
+
+
+if __name__ == "__main__":
+    main()
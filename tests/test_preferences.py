@@ -0,0 +1,163 @@
+"""Regressionstest: mtime-Caches und verzögertes Schreiben in api_config.
+
+- api_providers.json wird nur bei geänderter mtime neu geparst
+- save_last_selection() schreibt erst bei flush_preferences()
+- extern geänderte user_preferences.json wird neu gelesen
+- eine defekte user_preferences.json wird beim nächsten flush repariert
+- eine Modellauswahl im Hauptfenster landet über den Flush-Timer auf der
+  Platte, ohne auf atexit angewiesen zu sein
+
+Die Pfade werden auf ein temporäres Verzeichnis umgebogen; die echten
+Config-Dateien bleiben unberührt.
+
+Lauf (ohne pytest):  python tests/test_preferences.py
+"""
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+from unittest.mock import patch
+
+import orjson
+
+# Projekt-Root auf den Importpfad legen (Lauf ohne Installation/pytest)
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from src.config import api_config
+
+PROVIDERS = {
+    "default_provider": "openrouter",
+    "providers": [{
+        "id": "openrouter", "name": "OpenRouter",
+        "base_url": "https://openrouter.ai/api/v1",
+        "chat_endpoint": "/chat/completions", "models_endpoint": "/models",
+        "models": [{"id": "some/model", "name": "Some Model"}],
+    }],
+}
+
+
+def _bump_mtime(path: Path) -> None:
+    """Verschiebt die mtime sicher nach vorn (grobe Dateisystem-Auflösung)."""
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+
+def _isolated(tmp_path: Path):
+    """Biegt beide Config-Dateien auf tmp_path um und leert die Caches."""
+    api_config._PREFS.invalidate()
+    api_config._providers_cache = None
+    return (
+        patch.object(api_config, "_PROVIDERS_FILE", tmp_path / "api_providers.json"),
+        patch.object(api_config, "_PREFERENCES_FILE", tmp_path / "user_preferences.json"),
+    )
+
+
+def test_providers_mtime_cache(tmp_path: Path):
+    providers_patch, prefs_patch = _isolated(tmp_path)
+    with providers_patch, prefs_patch:
+        path = api_config._PROVIDERS_FILE
+        path.write_bytes(orjson.dumps(PROVIDERS))
+
+        first = api_config.load_providers()["openrouter"]
+        assert api_config.load_providers()["openrouter"] is first, "Cache nicht genutzt"
+        assert api_config.get_default_provider_id() == "openrouter"
+
+        changed = dict(PROVIDERS, default_provider="perplexity")
+        changed["providers"] = [dict(PROVIDERS["providers"][0], name="OpenRouter 2")]
+        path.write_bytes(orjson.dumps(changed))
+        _bump_mtime(path)
+        assert api_config.load_providers()["openrouter"].name == "OpenRouter 2", \
+            "geänderte Datei nicht neu geladen"
+        assert api_config.get_default_provider_id() == "perplexity"
+    api_config._providers_cache = None
+    print("  Provider-Cache: OK (Treffer, Neuladen bei mtime-Änderung)")
+
+
+def test_deferred_flush(tmp_path: Path):
+    providers_patch, prefs_patch = _isolated(tmp_path)
+    with providers_patch, prefs_patch:
+        path = api_config._PREFERENCES_FILE
+        api_config.save_preferences({"debug_logging": True})
+        assert orjson.loads(path.read_bytes()) == {"debug_logging": True}
+
+        api_config.save_last_selection("openrouter", "some/model")
+        assert api_config.get_last_model("openrouter") == "some/model"
+        assert "last_provider" not in orjson.loads(path.read_bytes()), \
+            "save_last_selection darf nicht sofort schreiben"
+
+        api_config.flush_preferences()
+        on_disk = orjson.loads(path.read_bytes())
+        assert on_disk["last_provider"] == "openrouter"
+        assert on_disk["last_models"] == {"openrouter": "some/model"}
+        assert on_disk["debug_logging"] is True
+
+        # Externe Änderung der Datei wird über die mtime erkannt
+        path.write_bytes(orjson.dumps({"last_provider": "perplexity"}))
+        _bump_mtime(path)
+        assert api_config.get_last_provider() == "perplexity", "externe Änderung ignoriert"
+
+        # load_preferences() liefert eine Kopie, nicht den Cache
+        api_config.load_preferences()["last_provider"] = "kaputt"
+        assert api_config.get_last_provider() == "perplexity", "Cache über Kopie verändert"
+    api_config._PREFS.invalidate()
+    print("  Preferences: OK (verzögertes flush, mtime-Neuladen, Kopie)")
+
+
+def test_corrupt_file_repaired(tmp_path: Path):
+    providers_patch, prefs_patch = _isolated(tmp_path)
+    with providers_patch, prefs_patch:
+        path = api_config._PREFERENCES_FILE
+        path.write_text("{kaputt", encoding="utf-8")
+
+        api_config.save_last_selection("openrouter", "some/model")
+        assert api_config.get_last_model("openrouter") == "some/model", \
+            "Auswahl nach Ladefehler verloren"
+        api_config.flush_preferences()
+        assert orjson.loads(path.read_bytes())["last_provider"] == "openrouter", \
+            "defekte Datei nicht überschrieben"
+    api_config._PREFS.invalidate()
+    print("  Preferences: OK (defekte Datei wird beim flush repariert)")
+
+
+def test_selection_flushed_by_timer(tmp_path: Path):
+    try:
+        from PyQt6.QtCore import QCoreApplication, QObject
+    except ImportError:
+        print("  Flush-Timer: PyQt6 nicht installiert -> uebersprungen")
+        return
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+    from src.gui.main_window import PREFS_FLUSH_DELAY_MS, MainWindow
+
+    app = QCoreApplication.instance() or QCoreApplication([])
+    # Nur der Timer-Teil des Hauptfensters, ohne die komplette UI
+    window = QObject()
+    MainWindow._setup_prefs_flush_timer(window)
+
+    providers_patch, prefs_patch = _isolated(tmp_path)
+    with providers_patch, prefs_patch:
+        path = api_config._PREFERENCES_FILE
+        MainWindow._remember_selection(window, "openrouter", "some/model")
+        assert not path.exists(), "Auswahl sollte erst nach dem Timer geschrieben werden"
+
+        deadline = time.monotonic() + PREFS_FLUSH_DELAY_MS / 1000 + 5
+        while not path.exists() and time.monotonic() < deadline:
+            app.processEvents()
+            time.sleep(0.05)
+        assert path.exists(), "Flush-Timer hat nicht geschrieben"
+        assert orjson.loads(path.read_bytes())["last_models"] == {"openrouter": "some/model"}
+    api_config._PREFS.invalidate()
+    print("  Flush-Timer: OK (Auswahl ohne atexit auf der Platte)")
+
+
+def main():
+    print("Tests api_config-Caches:")
+    for test in (test_providers_mtime_cache, test_deferred_flush,
+                 test_corrupt_file_repaired, test_selection_flushed_by_timer):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            test(Path(tmp_dir))
+    print("ALLE TESTS OK")
+
+
+if __name__ == "__main__":
+    main()
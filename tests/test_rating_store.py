@@ -0,0 +1,210 @@
+"""Regressionstest: RatingStore (Migration, Batch-Insert, Lese-Verbindung, UPDATEs).
+
+Geprüft wird gegen eine temporäre DB (db_path), nie gegen ~/.somas_prompt_generator:
+- Alt-DBs (v1 ohne Versionierung, v2 mit Rowid-channels) landen auf Version 5,
+  channels ist danach WITHOUT ROWID und behält seine Zeilen
+- save_analyses() liefert die IDs in Eingabereihenfolge und speichert bei
+  einem fehlerhaften Datensatz gar nichts
+- die query_only-Lese-Verbindung sieht committete Schreibvorgänge
+- unveränderte Bewertungen lösen kein UPDATE aus (NULL-sicher)
+
+Lauf (ohne pytest):  python tests/test_rating_store.py
+"""
+import sqlite3
+import sys
+import tempfile
+from pathlib import Path
+
+# Projekt-Root auf den Importpfad legen (Lauf ohne Installation/pytest)
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from src.core.rating_store import (
+    CURRENT_SCHEMA_VERSION,
+    SCHEMA_V1_SQL,
+    AnalysisRecord,
+    RatingStore,
+)
+
+# channels-Layout von Version 2 vor dem Umbau (Rowid-Tabelle)
+LEGACY_CHANNELS_SQL = """
+CREATE TABLE channels (
+    channel_name    TEXT PRIMARY KEY,
+    factual_score   INTEGER DEFAULT 0,
+    argument_score  INTEGER DEFAULT 0,
+    bias_direction  TEXT DEFAULT '',
+    bias_strength   INTEGER DEFAULT 0,
+    mode_tags       TEXT DEFAULT '',
+    notes           TEXT DEFAULT '',
+    updated_at      TEXT DEFAULT (datetime('now'))
+);
+"""
+
+
+def _record(**overrides) -> AnalysisRecord:
+    values = dict(provider_id="openrouter", model_id="some/model",
+                  model_name="Some Model", preset_name="Standard",
+                  result_chars=100, response_time=1.5)
+    values.update(overrides)
+    return AnalysisRecord(**values)
+
+
+def _inspect(db_path: Path) -> tuple[int, str, set[str]]:
+    """Gibt (Schema-Version, channels-SQL, Indexnamen) der DB zurück."""
+    conn = sqlite3.connect(str(db_path))
+    try:
+        version = conn.execute("SELECT MAX(version) FROM schema_version").fetchone()[0]
+        channels_sql = conn.execute(
+            "SELECT sql FROM sqlite_master WHERE type='table' AND name='channels'"
+        ).fetchone()[0]
+        indexes = {row[0] for row in conn.execute(
+            "SELECT name FROM sqlite_master WHERE type='index'"
+        )}
+    finally:
+        conn.close()
+    return version, channels_sql, indexes
+
+
+def test_migration_from_v1(tmp_path: Path):
+    db_path = tmp_path / "v1.db"
+    conn = sqlite3.connect(str(db_path))
+    conn.executescript(SCHEMA_V1_SQL)
+    conn.execute(
+        "INSERT INTO analyses (provider_id, model_id, model_name, preset_name, "
+        "result_chars, response_time) VALUES ('p', 'm', 'M', 'Standard', 10, 1.0)"
+    )
+    conn.commit()
+    conn.close()
+
+    store = RatingStore(db_path)
+    store.close()
+    version, channels_sql, indexes = _inspect(db_path)
+    assert version == CURRENT_SCHEMA_VERSION, f"v1: Version {version}"
+    assert "WITHOUT ROWID" in channels_sql.upper(), "v1: channels nicht WITHOUT ROWID"
+    assert {"idx_model_rating", "idx_channel_rating"} <= indexes, "v1: Indizes fehlen"
+    print("  Migration v1 -> v5: OK")
+
+
+def test_migration_from_v2(tmp_path: Path):
+    db_path = tmp_path / "v2.db"
+    conn = sqlite3.connect(str(db_path))
+    conn.executescript(SCHEMA_V1_SQL)
+    conn.executescript(LEGACY_CHANNELS_SQL)
+    conn.execute("ALTER TABLE analyses ADD COLUMN model_rating_z INTEGER")
+    conn.execute("CREATE TABLE schema_version (version INTEGER PRIMARY KEY)")
+    conn.execute("INSERT INTO schema_version (version) VALUES (2)")
+    conn.execute(
+        "INSERT INTO channels (channel_name, factual_score, notes) "
+        "VALUES ('Kanal A', 2, 'Notiz')"
+    )
+    conn.commit()
+    conn.close()
+
+    store = RatingStore(db_path)
+    row = store.get_channel_rating("Kanal A")
+    store.close()
+    version, channels_sql, _ = _inspect(db_path)
+    assert version == CURRENT_SCHEMA_VERSION, f"v2: Version {version}"
+    assert "WITHOUT ROWID" in channels_sql.upper(), "v2: channels nicht umgebaut"
+    assert row is not None and row["factual_score"] == 2 and row["notes"] == "Notiz", \
+        "v2: Kanal-Zeile beim Umbau verloren"
+    print("  Migration v2 -> v5 (channels-Umbau): OK")
+
+
+def test_save_analyses(tmp_path: Path):
+    store = RatingStore(tmp_path / "batch.db")
+    try:
+        assert store.save_analyses([]) == []
+        first = store.save_analysis(_record())
+        ids = store.save_analyses([_record(model_id=f"m{i}") for i in range(3)])
+        assert ids == [first + 1, first + 2, first + 3], f"IDs: {ids}"
+        with store._lock:
+            model_ids = [row[0] for row in store._connect().execute(
+                "SELECT model_id FROM analyses WHERE id IN (?, ?, ?) ORDER BY id", ids
+            )]
+        assert model_ids == ["m0", "m1", "m2"], "Reihenfolge der IDs"
+
+        # provider_id ist NOT NULL -> zweiter Datensatz scheitert, nichts bleibt
+        try:
+            store.save_analyses([_record(model_id="ok"), _record(provider_id=None)])
+        except sqlite3.IntegrityError:
+            pass
+        else:
+            raise AssertionError("fehlerhafter Datensatz sollte IntegrityError werfen")
+        with store._lock:
+            count = store._connect().execute("SELECT COUNT(*) FROM analyses").fetchone()[0]
+        assert count == 4, f"Rollback unvollständig: {count} Zeilen"
+    finally:
+        store.close()
+    print("  save_analyses: OK (IDs in Reihenfolge, Rollback)")
+
+
+def test_read_connection_sees_writes(tmp_path: Path):
+    store = RatingStore(tmp_path / "ro.db")
+    try:
+        # Lese-Verbindung vor dem Schreiben öffnen
+        assert store.get_channel_rating("Kanal B") is None
+        assert store.get_all_channels() == []
+        store.save_channel_rating("Kanal B", factual_score=1, notes="erste")
+        assert store.get_channel_rating("Kanal B")["notes"] == "erste"
+        store.save_channel_rating("Kanal B", factual_score=-1, notes="zweite")
+        rows = store.get_all_channels()
+        assert [r["notes"] for r in rows] == ["zweite"], "UPSERT nicht sichtbar"
+
+        analysis_id = store.save_analysis(_record())
+        store.update_chosen_module(analysis_id, "KRITIK")
+        assert store.get_recent_modules(1) == ["KRITIK"]
+
+        try:
+            store._connect_ro().execute("DELETE FROM channels")
+        except sqlite3.OperationalError:
+            pass
+        else:
+            raise AssertionError("Lese-Verbindung darf nicht schreiben")
+    finally:
+        store.close()
+    print("  Lese-Verbindung: OK (sieht Commits, query_only)")
+
+
+def test_noop_updates(tmp_path: Path):
+    store = RatingStore(tmp_path / "noop.db")
+    try:
+        analysis_id = store.save_analysis(_record())
+        with store._lock:
+            conn = store._connect()
+
+        def changes_after(func, *args, **kwargs) -> int:
+            before = conn.total_changes
+            func(*args, **kwargs)
+            return conn.total_changes - before
+
+        # Alles NULL -> "nicht bewertet" ändert nichts
+        assert changes_after(store.update_ratings, analysis_id) == 0, "NULL -> NULL"
+        assert changes_after(store.update_ratings, analysis_id, quality_score=4) == 1
+        assert changes_after(store.update_ratings, analysis_id, quality_score=4) == 0
+        assert changes_after(store.update_ratings, analysis_id, quality_score=4,
+                             channel_balanced=-1) == 1
+        # Zurück auf "nicht bewertet" (Wert -> NULL) muss schreiben
+        assert changes_after(store.update_ratings, analysis_id) == 1, "Wert -> NULL"
+
+        assert changes_after(store.update_model_rating_z, analysis_id, 0) == 1, "NULL -> 0"
+        assert changes_after(store.update_model_rating_z, analysis_id, 0) == 0
+        assert changes_after(store.update_model_rating_z, analysis_id, 2) == 1
+    finally:
+        store.close()
+    print("  No-Op-UPDATEs: OK (NULL-sicher)")
+
+
+def main():
+    print("Tests RatingStore:")
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        tmp = Path(tmp_dir)
+        test_migration_from_v1(tmp)
+        test_migration_from_v2(tmp)
+        test_save_analyses(tmp)
+        test_read_connection_sees_writes(tmp)
+        test_noop_updates(tmp)
+    print("ALLE TESTS OK")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,176 @@
+"""Regressionstest: SQLite-Cache für YouTube-Metadaten und Transkripte.
+
+- Treffer/Miss pro video_id bzw. (video_id, Sprache)
+- Einträge älter als die TTL gelten als Miss und werden beim Speichern ersetzt
+- get_transcript() cacht ein Fallback-Transkript (z.B. en statt de) für die
+  angefragte und für seine tatsächliche Sprache; ein Fallback überschreibt
+  nie ein gültiges Transkript in der angefragten Sprache
+- ein Cache im alten Format (Transkripte ohne source_language) wird verworfen
+- get_video_info() cacht keine Platzhalter bei unvollständiger yt-dlp-Antwort
+
+Der Cache liegt in einem temporären Verzeichnis; es gibt keine Netzwerkzugriffe.
+
+Lauf (ohne pytest):  python tests/test_video_cache.py
+"""
+import sqlite3
+import sys
+import tempfile
+import time
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+# Projekt-Root auf den Importpfad legen (Lauf ohne Installation/pytest)
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from youtube_transcript_api import NoTranscriptFound
+
+from src.core import youtube_client
+from src.core.youtube_client import _VIDEO_CACHE_TTL_SECONDS, _VideoCache
+
+VIDEO_ID = "dQw4w9WgXcQ"
+URL = f"https://www.youtube.com/watch?v={VIDEO_ID}"
+
+
+def _close(cache: _VideoCache) -> None:
+    if cache._conn is not None:
+        cache._conn.close()
+        cache._conn = None
+
+
+def test_hit_and_miss(tmp_path: Path):
+    cache = _VideoCache(tmp_path / "video_cache.db")
+    try:
+        assert cache.get_meta(VIDEO_ID) is None, "leerer Cache -> Miss"
+        cache.put_meta(VIDEO_ID, "Titel", "Kanal", None)
+        assert cache.get_meta(VIDEO_ID) == ("Titel", "Kanal", None), "Dauer None bleibt None"
+        assert cache.get_meta("anderesVideo") is None
+
+        cache.put_transcript(VIDEO_ID, "de", "Hallo Welt")
+        assert cache.get_transcript(VIDEO_ID, "de") == "Hallo Welt"
+        assert cache.get_transcript(VIDEO_ID, "en") is None, "andere Sprache -> Miss"
+    finally:
+        _close(cache)
+    print("  Video-Cache: OK (Treffer/Miss)")
+
+
+def test_ttl(tmp_path: Path):
+    cache = _VideoCache(tmp_path / "video_cache.db")
+    try:
+        stored_at = time.time() - _VIDEO_CACHE_TTL_SECONDS - 60
+        with patch.object(youtube_client.time, "time", return_value=stored_at):
+            cache.put_meta(VIDEO_ID, "Alt", "Kanal", 60)
+            cache.put_transcript(VIDEO_ID, "de", "alt")
+        assert cache.get_meta(VIDEO_ID) is None, "abgelaufene Metadaten"
+        assert cache.get_transcript(VIDEO_ID, "de") is None, "abgelaufenes Transkript"
+
+        # Neu speichern ersetzt den abgelaufenen Eintrag
+        cache.put_meta(VIDEO_ID, "Neu", "Kanal", 60)
+        assert cache.get_meta(VIDEO_ID) == ("Neu", "Kanal", 60)
+    finally:
+        _close(cache)
+    print("  Video-Cache: OK (TTL)")
+
+
+def test_transcript_fallback_language(tmp_path: Path):
+    cache = _VideoCache(tmp_path / "video_cache.db")
+    fallback = MagicMock(language_code="en")
+    fallback.fetch.return_value = [MagicMock(text="Hello"), MagicMock(text="world")]
+    transcript_list = MagicMock()
+
+    def find_transcript(languages):
+        if languages == ["en"]:
+            return fallback
+        raise NoTranscriptFound(VIDEO_ID, languages, transcript_list)
+
+    transcript_list.find_transcript.side_effect = find_transcript
+    try:
+        with patch.object(youtube_client, "_video_cache", cache), \
+                patch.object(youtube_client, "YouTubeTranscriptApi") as api:
+            api.return_value.list.return_value = transcript_list
+            assert youtube_client.get_transcript(URL, "de") == "Hello world"
+            assert cache.get_transcript(VIDEO_ID, "de") == "Hello world"
+            assert cache.get_transcript(VIDEO_ID, "en") == "Hello world"
+
+            # de- und en-Anfragen kommen jetzt aus dem Cache (kein API-Call)
+            api.reset_mock()
+            assert youtube_client.get_transcript(URL, "de") == "Hello world"
+            assert youtube_client.get_transcript(URL, "en") == "Hello world"
+            api.assert_not_called()
+    finally:
+        _close(cache)
+    print("  Transkript-Cache: OK (Fallback-Treffer für angefragte Sprache)")
+
+
+def test_fallback_keeps_direct_transcript(tmp_path: Path):
+    cache = _VideoCache(tmp_path / "video_cache.db")
+    try:
+        cache.put_transcript(VIDEO_ID, "en", "direkt")
+        # en angefragt, aber nur de gefunden: darf das echte en nicht ersetzen
+        cache.put_transcript(VIDEO_ID, "en", "Fallback", source_language="de")
+        assert cache.get_transcript(VIDEO_ID, "en") == "direkt"
+        assert cache.get_transcript(VIDEO_ID, "de") == "Fallback"
+
+        # Umgekehrt ersetzt ein echtes Transkript einen Fallback-Eintrag
+        cache.put_transcript(VIDEO_ID, "fr", "Fallback", source_language="de")
+        cache.put_transcript(VIDEO_ID, "fr", "direct")
+        assert cache.get_transcript(VIDEO_ID, "fr") == "direct"
+    finally:
+        _close(cache)
+    print("  Transkript-Cache: OK (echtes Transkript hat Vorrang)")
+
+
+def test_old_cache_format_dropped(tmp_path: Path):
+    path = tmp_path / "video_cache.db"
+    conn = sqlite3.connect(str(path))
+    conn.execute(
+        "CREATE TABLE transcripts (video_id TEXT NOT NULL, language TEXT NOT NULL, "
+        "transcript TEXT NOT NULL, fetched_at REAL NOT NULL, "
+        "PRIMARY KEY (video_id, language)) WITHOUT ROWID"
+    )
+    conn.execute("INSERT INTO transcripts VALUES (?, 'de', 'alt', ?)",
+                 (VIDEO_ID, time.time()))
+    conn.commit()
+    conn.close()
+
+    cache = _VideoCache(path)
+    try:
+        assert cache.get_transcript(VIDEO_ID, "de") is None, "altes Format nicht verworfen"
+        cache.put_transcript(VIDEO_ID, "de", "neu")
+        assert cache.get_transcript(VIDEO_ID, "de") == "neu"
+    finally:
+        _close(cache)
+    print("  Video-Cache: OK (altes Format verworfen)")
+
+
+def test_partial_meta_not_cached(tmp_path: Path):
+    cache = _VideoCache(tmp_path / "video_cache.db")
+    try:
+        with patch.object(youtube_client, "_video_cache", cache), \
+                patch.object(youtube_client, "get_transcript", return_value=None), \
+                patch.object(youtube_client.yt_dlp, "YoutubeDL") as ydl:
+            extract_info = ydl.return_value.__enter__.return_value.extract_info
+            extract_info.return_value = {"duration": 60}
+            info = youtube_client.get_video_info(URL)
+            assert info.title == "Unbekannter Titel"
+            assert cache.get_meta(VIDEO_ID) is None, "Platzhalter gecacht"
+
+            extract_info.return_value = {"title": "Titel", "uploader": "Kanal", "duration": 60}
+            youtube_client.get_video_info(URL)
+            assert cache.get_meta(VIDEO_ID) == ("Titel", "Kanal", 60)
+    finally:
+        _close(cache)
+    print("  Video-Cache: OK (keine Platzhalter-Metadaten)")
+
+
+def main():
+    print("Tests Video-Cache:")
+    for test in (test_hit_and_miss, test_ttl, test_transcript_fallback_language,
+                 test_fallback_keeps_direct_transcript, test_old_cache_format_dropped,
+                 test_partial_meta_not_cached):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            test(Path(tmp_dir))
+    print("ALLE TESTS OK")
+
+
+if __name__ == "__main__":
+    main()